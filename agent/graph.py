@@ -5,14 +5,19 @@ Defines the graph structure with nodes and edges for
 processing logs, analyzing errors, and creating fixes.
 """
 
+import functools
+import hashlib
 from typing import Annotated, Any, TypedDict, Literal
 from pathlib import Path
 
+from langgraph.cache.memory import InMemoryCache
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
+from langgraph.types import CachePolicy
 
-from .nodes.log_parser import parse_logs_node
-from .nodes.error_analyzer import analyze_error_node
+from .nodes.log_parser import ContextIndex, parse_logs_node
+from .nodes.error_analyzer import analyze_error_node, create_llm
 from .nodes.fix_generator import generate_fix_node
 from .nodes.github_integration import create_pr_node
 from .models.log_entry import LogEntry
@@ -20,6 +25,25 @@ from .models.error_report import ErrorReport
 from .models.fix_proposal import FixProposal
 
 
+# Time-to-live (seconds) for cached node results
+NODE_CACHE_TTL = 3600
+
+# Model types that cached node results may contain
+_CACHED_MODEL_TYPES = [
+    ("agent.models.log_entry", "LogEntry"),
+    ("agent.models.error_report", "ErrorReport"),
+    ("agent.models.error_report", "ErrorType"),
+    ("agent.models.fix_proposal", "FixProposal"),
+    ("agent.models.fix_proposal", "FixType"),
+    ("agent.models.fix_proposal", "CodeChange"),
+]
+
+# Shared node cache so repeated compilations reuse earlier results
+_node_cache = InMemoryCache(
+    serde=JsonPlusSerializer(allowed_msgpack_modules=_CACHED_MODEL_TYPES)
+)
+
+
 class AgentState(TypedDict, total=False):
     """
     State for the Log Analyzer Agent graph.
@@ -37,6 +61,7 @@ class AgentState(TypedDict, total=False):
     
     # Parsed data
     log_entries: list[LogEntry]         # All parsed log entries
+    context_index: ContextIndex         # Per-thread index of log_entries
     error_entries: list[LogEntry]       # Only ERROR/CRITICAL entries
     
     # Processing state
@@ -45,6 +70,7 @@ class AgentState(TypedDict, total=False):
     
     # Analysis results
     current_error_report: ErrorReport | None   # Analysis of current error
+    error_reports: list[ErrorReport | None]    # Batched analyses, by error index
     fix_proposal: FixProposal | None           # Generated fix
     
     # Human-in-the-loop
@@ -67,11 +93,11 @@ class AgentState(TypedDict, total=False):
 def should_continue_processing(state: AgentState) -> Literal["analyze", "done"]:
     """
     Determine if there are more errors to process.
-    """
-    index = state.get("current_error_index", 0)
-    total = state.get("total_errors", 0)
     
-    if index < total:
+    Both counters are always set by parse_logs_node, so they are
+    read directly on this hot edge.
+    """
+    if state["current_error_index"] < state["total_errors"]:
         return "analyze"
     return "done"
 
@@ -80,23 +106,65 @@ def should_create_pr(state: AgentState) -> Literal["create_pr", "skip_pr", "next
     """
     Determine if we should create a PR based on user approval.
     """
-    if not state.get("user_approved", False):
+    if not state.get("user_approved"):
         return "next_error"
     
     fix = state.get("fix_proposal")
-    if fix is None or not fix.requires_pr:
-        return "skip_pr"
+    if fix is not None and fix.requires_pr:
+        return "create_pr"
     
-    return "create_pr"
+    return "skip_pr"
+
+
+def _digest(*parts: object) -> str:
+    """Build a stable cache key from the given parts."""
+    joined = "\x1f".join(str(part) for part in parts)
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+
+def _analyze_cache_key(state: AgentState) -> str:
+    """
+    Cache key for analyze_error: the file, function and message of each
+    error the node will analyze.
+    
+    The first visit analyzes every remaining error as one batch, so
+    its key covers all of them; later visits only read one report.
+    """
+    errors = state.get("error_entries", [])
+    index = state.get("current_error_index", 0)
+    if index >= len(errors):
+        return _digest("no-error")
+    
+    batch = errors[index:] if not state.get("error_reports") else errors[index:index + 1]
+    return _digest(*(
+        (error.source_file, error.function_name, error.message)
+        for error in batch
+    ))
+
+
+def _fix_cache_key(state: AgentState) -> str:
+    """
+    Cache key for generate_fix: the analyzed error's file, function and message.
+    """
+    report = state.get("current_error_report")
+    if report is None:
+        return _digest("no-report")
+    
+    return _digest(
+        report.affected_file,
+        report.primary_error.function_name,
+        report.primary_error.message
+    )
 
 
 def advance_to_next_error(state: AgentState) -> AgentState:
     """
     Node to advance to the next error in the list.
+    
+    Only the reset keys are returned; LangGraph merges them into the state.
     """
     current_index = state.get("current_error_index", 0)
     return {
-        **state,
         "current_error_index": current_index + 1,
         "current_error_report": None,
         "fix_proposal": None,
@@ -136,8 +204,18 @@ def create_agent_graph() -> StateGraph:
     
     # Add nodes
     graph.add_node("parse_logs", parse_logs_node)
-    graph.add_node("analyze_error", analyze_error_node)
-    graph.add_node("generate_fix", generate_fix_node)
+    graph.add_node(
+        "analyze_error",
+        analyze_error_node,
+        cache_policy=CachePolicy(key_func=_analyze_cache_key, ttl=NODE_CACHE_TTL)
+    )
+    graph.add_node(
+        "generate_fix",
+        generate_fix_node,
+        cache_policy=CachePolicy(key_func=_fix_cache_key, ttl=NODE_CACHE_TTL)
+    )
+    # Not node-cached: a failed attempt must be retried, and create_pr_node
+    # itself returns the earlier PR for a fix that was already opened
     graph.add_node("create_pr", create_pr_node)
     graph.add_node("advance_error", advance_to_next_error)
     
@@ -186,15 +264,21 @@ def create_agent_graph() -> StateGraph:
     return graph
 
 
+@functools.lru_cache(maxsize=1)
 def compile_agent():
     """
     Compile the agent graph for execution.
     
+    Identical errors and fixes are served from the node cache
+    instead of calling the LLM again. The graph topology is static,
+    so the compiled graph is built once and reused.
+    
     Returns:
         Compiled LangGraph that can be invoked
     """
     graph = create_agent_graph()
     return graph.compile(
+        cache=_node_cache,
         # Interrupt after generate_fix for human confirmation
         interrupt_after=["generate_fix"]
     )
@@ -224,6 +308,7 @@ def run_agent_single_error(
         log_content=log_content,
         source_dir=source_dir,
         repo_root=repo_root,
+        llm=create_llm(),
         current_error_index=0,
         user_approved=False,
         should_continue=True
@@ -5,7 +5,12 @@ Provides an interactive command-line interface for analyzing logs,
 reviewing fix proposals, and creating GitHub PRs.
 """
 
+import asyncio
+import functools
+import sys
+import threading
 from pathlib import Path
+from string import Template
 from typing import Optional
 
 import typer
@@ -17,14 +22,25 @@ from rich.syntax import Syntax
 from rich.markdown import Markdown
 from rich import print as rprint
 
-from .graph import compile_agent, AgentState
-from .nodes.log_parser import parse_log_file, parse_log_content, extract_errors
+try:
+    # Optional faster event loop
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from .nodes.log_parser import (
+    parse_log_file,
+    parse_log_content,
+    extract_errors,
+    collect_error_groups,
+)
 from .nodes.error_analyzer import analyze_error_sync, create_llm
 from .nodes.fix_generator import generate_fix_sync
-from .nodes.github_integration import GitHubIntegration, apply_code_change
+from .nodes.github_integration import get_github_integration, apply_code_change, new_fix_branch_name
 from .utils.config import get_config, Config
+from .utils.mcp_client import github_session
 from .models.log_entry import LogEntry
-from .models.error_report import ErrorReport
+from .models.error_report import ErrorReport, ERROR_TYPE_NAMES
 from .models.fix_proposal import FixProposal
 
 
@@ -50,26 +66,54 @@ def check_config() -> Config:
     return config
 
 
-def display_error_report(report: ErrorReport) -> None:
-    """Display an error report in a nice format."""
-    # Create panel for the error
-    severity_color = "red" if report.primary_error.is_critical() else "yellow"
-    
-    content = f"""[bold]File:[/bold] {report.affected_file}:{report.affected_line}
-[bold]Function:[/bold] {report.primary_error.function_name}
-[bold]Type:[/bold] {report.error_type.value}
-[bold]Is Code Issue:[/bold] {"Yes" if report.is_code_issue else "No (Config/Data)"}
+# Panel templates with the static markup prepared once at import
+_ERROR_REPORT_TEMPLATE = Template("""[bold]File:[/bold] $file:$line
+[bold]Function:[/bold] $function
+[bold]Type:[/bold] $error_type
+[bold]Is Code Issue:[/bold] $is_code_issue
 
 [bold]Message:[/bold]
-{report.primary_error.message}
+$message
 
 [bold]Root Cause:[/bold]
-{report.root_cause}
+$root_cause
 
 [bold]Suggested Approach:[/bold]
-{report.suggested_approach}
+$suggested_approach
+
+[dim]Confidence: $confidence[/dim]""")
 
-[dim]Confidence: {report.confidence:.0%}[/dim]"""
+_FIX_PROPOSAL_TEMPLATE = Template("""[bold]Type:[/bold] $fix_type
+[bold]Risk:[/bold] [$risk_color]$risk_level[/$risk_color]
+[bold]Confidence:[/bold] $confidence
+
+[bold]Description:[/bold]
+$description
+""")
+
+
+@functools.lru_cache(maxsize=64)
+def _cpp_syntax(code: str) -> Syntax:
+    """Get a (cached) syntax-highlighted view of C++ code."""
+    return Syntax(code, "cpp", theme="monokai", line_numbers=True)
+
+
+def display_error_report(report: ErrorReport) -> None:
+    """Display an error report in a nice format."""
+    # Create panel for the error
+    severity_color = "red" if report.primary_error.is_critical() else "yellow"
+    
+    content = _ERROR_REPORT_TEMPLATE.substitute(
+        file=report.affected_file,
+        line=report.affected_line,
+        function=report.primary_error.function_name,
+        error_type=ERROR_TYPE_NAMES[report.error_type],
+        is_code_issue="Yes" if report.is_code_issue else "No (Config/Data)",
+        message=report.primary_error.message,
+        root_cause=report.root_cause,
+        suggested_approach=report.suggested_approach,
+        confidence=f"{report.confidence:.0%}"
+    )
     
     panel = Panel(
         content,
@@ -83,34 +127,36 @@ def display_fix_proposal(fix: FixProposal) -> None:
     """Display a fix proposal in a nice format."""
     risk_color = {"low": "green", "medium": "yellow", "high": "red"}.get(fix.risk_level, "white")
     
-    content = f"""[bold]Type:[/bold] {fix.fix_type.value}
-[bold]Risk:[/bold] [{risk_color}]{fix.risk_level}[/{risk_color}]
-[bold]Confidence:[/bold] {fix.confidence:.0%}
-
-[bold]Description:[/bold]
-{fix.description}
-"""
+    parts: list[str] = [
+        _FIX_PROPOSAL_TEMPLATE.substitute(
+            fix_type=fix.fix_type.value,
+            risk_color=risk_color,
+            risk_level=fix.risk_level,
+            confidence=f"{fix.confidence:.0%}",
+            description=fix.description
+        )
+    ]
     
     # Show code changes
     if fix.code_changes:
-        content += "\n[bold]📝 Code Changes:[/bold]\n"
+        parts.append("\n[bold]📝 Code Changes:[/bold]\n")
         for change in fix.code_changes:
-            content += f"\n  [cyan]{change.file_path}[/cyan] (lines {change.line_start}-{change.line_end})\n"
-            content += f"  [dim]{change.explanation}[/dim]\n"
+            parts.append(f"\n  [cyan]{change.file_path}[/cyan] (lines {change.line_start}-{change.line_end})\n")
+            parts.append(f"  [dim]{change.explanation}[/dim]\n")
     
     # Show config/data changes
     if fix.config_changes:
-        content += "\n[bold]⚙️ Configuration Changes:[/bold]\n"
-        for key, value in fix.config_changes.items():
-            content += f"  {key} = {value}\n"
+        parts.append("\n[bold]⚙️ Configuration Changes:[/bold]\n")
+        parts.extend(f"  {key} = {value}\n" for key, value in fix.config_changes.items())
     
     if fix.data_operations:
-        content += "\n[bold]🗃️ Data Operations:[/bold]\n"
-        for op in fix.data_operations:
-            content += f"  {op}\n"
+        parts.append("\n[bold]🗃️ Data Operations:[/bold]\n")
+        parts.extend(f"  {op}\n" for op in fix.data_operations)
     
     if fix.manual_instructions:
-        content += f"\n[bold yellow]⚠️ Manual Steps Required:[/bold yellow]\n{fix.manual_instructions}\n"
+        parts.append(f"\n[bold yellow]⚠️ Manual Steps Required:[/bold yellow]\n{fix.manual_instructions}\n")
+    
+    content = "".join(parts)
     
     panel = Panel(
         content,
@@ -124,33 +170,170 @@ def display_fix_proposal(fix: FixProposal) -> None:
         for change in fix.code_changes:
             if change.original_code and change.new_code:
                 console.print("\n[bold]Original Code:[/bold]")
-                syntax = Syntax(change.original_code, "cpp", theme="monokai", line_numbers=True)
-                console.print(syntax)
+                console.print(_cpp_syntax(change.original_code))
                 
                 console.print("\n[bold]New Code:[/bold]")
-                syntax = Syntax(change.new_code, "cpp", theme="monokai", line_numbers=True)
-                console.print(syntax)
+                console.print(_cpp_syntax(change.new_code))
 
 
-def run_interactive_analysis(
+# Number of error groups analyzed ahead of the one being reviewed
+PREFETCH_DEPTH = 3
+
+
+def _analyze_and_fix(
+    error_group: list[LogEntry],
+    context_entries: list[LogEntry],
+    source_dir: Path,
+    llm,
+    stop: threading.Event
+) -> tuple[ErrorReport | None, FixProposal | None, str | None]:
+    """
+    Analyze an error group and generate its fix (runs in a worker thread).
+    
+    Cancelling the awaiting task doesn't stop the thread, so stop is
+    checked before each LLM call to skip work nobody will review.
+    
+    Returns:
+        Tuple of (report, fix, error message if a step failed or was skipped)
+    """
+    primary_error = error_group[0]
+    
+    if stop.is_set():
+        return None, None, "Analysis cancelled"
+    
+    try:
+        # Analyze the PRIMARY error but with ALL context
+        report = analyze_error_sync(primary_error, context_entries, source_dir, llm)
+        
+        # Update the report to mention all related errors
+        if len(error_group) > 1:
+            report.root_cause = f"[Group of {len(error_group)} related errors]\n\n{report.root_cause}"
+    except Exception as e:
+        return None, None, f"Error during analysis: {e}"
+    
+    if stop.is_set():
+        return report, None, "Fix generation cancelled"
+    
+    try:
+        fix = generate_fix_sync(report, source_dir, llm)
+    except Exception as e:
+        return report, None, f"Error generating fix: {e}"
+    
+    return report, fix, None
+
+
+async def _prepare_group(
+    error_group: list[LogEntry],
+    context_entries: list[LogEntry],
+    source_dir: Path,
+    llm,
+    semaphore: asyncio.Semaphore,
+    stop: threading.Event
+) -> tuple[ErrorReport | None, FixProposal | None, str | None]:
+    """
+    Analyze an error group and generate its fix in a worker thread.
+    
+    The sync node helpers are run via asyncio.to_thread because the MCP
+    wrappers they call manage their own event loops.
+    
+    Returns:
+        Tuple of (report, fix, error message if a step failed)
+    """
+    async with semaphore:
+        return await asyncio.to_thread(
+            _analyze_and_fix, error_group, context_entries, source_dir, llm, stop
+        )
+
+
+async def _prefetch_groups(
+    error_groups: list[list[LogEntry]],
+    group_contexts: list[list[LogEntry]],
+    source_dir: Path,
+    llm,
+    queue: asyncio.Queue,
+    stop: threading.Event
+) -> None:
+    """
+    Start analysis tasks for each error group in order.
+    
+    The bounded queue limits how far ahead of the user we analyze.
+    Setting stop makes worker threads skip their remaining LLM calls.
+    """
+    # Cap concurrent LLM analyses to respect provider rate limits
+    semaphore = asyncio.Semaphore(get_config().max_concurrency)
+    
+    for error_group, context_entries in zip(error_groups, group_contexts):
+        task = asyncio.create_task(
+            _prepare_group(error_group, context_entries, source_dir, llm, semaphore, stop)
+        )
+        await queue.put((context_entries, task))
+
+
+async def _create_pr_for_fix(fix: FixProposal, config: Config) -> None:
+    """Create a branch, push the fixed files and open a PR."""
+    gh = get_github_integration(
+        token=config.github_token,
+        repo_name=config.github_repo,
+        target_branch=config.github_target_branch
+    )
+    
+    branch_name = new_fix_branch_name()
+    
+    # One MCP server session for the branch, push and PR
+    async with github_session():
+        await gh.create_branch_async(branch_name)
+        
+        # Push every changed file in one commit (one round-trip)
+        files = [
+            # Use the LLM's suggested new code (path is relative to repo root)
+            {"path": change.file_path, "content": change.new_code}
+            for change in fix.code_changes
+        ]
+        
+        try:
+            await gh.update_files_async(files=files, branch=branch_name, commit_message=fix.get_commit_message())
+        except Exception as push_err:
+            console.print(f"[yellow]⚠️ Could not update files: {push_err}[/yellow]")
+            console.print("[red]❌ No files were updated - cannot create PR[/red]")
+            console.print("[dim]The file paths from the fix may not exist in the GitHub repo.[/dim]")
+            return
+        
+        pr_url = await gh.create_pull_request_async(
+            title=fix.title,
+            body=fix.get_pr_body(),
+            head_branch=branch_name
+        )
+    
+    console.print(f"\n[bold green]✅ PR created successfully![/bold green]")
+    console.print(f"[link={pr_url}]{pr_url}[/link]\n")
+
+
+async def _confirm(prompt: str, default: bool) -> bool:
+    """Ask for confirmation without blocking background analyses."""
+    return await asyncio.to_thread(Confirm.ask, prompt, default=default)
+
+
+async def run_interactive_analysis_async(
     log_content: str,
     source_dir: Path,
     repo_root: Path,
-    dry_run: bool = False
+    dry_run: bool = False,
+    llm=None
 ) -> None:
     """
     Run interactive analysis on log content.
     
     Analyzes related errors TOGETHER for better context understanding.
+    Later groups are analyzed in the background while the user reviews
+    the current one.
     
     Args:
         log_content: Pre-filtered log content to analyze
         source_dir: Path to source files
         repo_root: Path to repository root
         dry_run: If True, don't create PRs
+        llm: Optional LLM instance (created from config if not given)
     """
-    from .nodes.log_parser import group_errors_by_context, get_full_context_for_group
-    
     config = check_config()
     
     if not config.is_configured:
@@ -161,132 +344,155 @@ def run_interactive_analysis(
     # Parse logs
     console.print("\n[bold]📋 Parsing logs...[/bold]")
     entries = parse_log_content(log_content)
-    errors = extract_errors(entries)
+    
+    # Extract errors, group related ones and gather their context in one pass
+    errors, error_groups, group_contexts = collect_error_groups(entries)
     
     if not errors:
         console.print("[green]✅ No errors found in the logs![/green]")
         return
     
-    # Group related errors
-    error_groups = group_errors_by_context(entries, errors)
-    
     console.print(f"[cyan]Found {len(errors)} error(s) grouped into {len(error_groups)} issue(s) to analyze.[/cyan]")
     console.print(f"[dim]Errors are grouped by source file and function for holistic analysis.[/dim]\n")
     
     # Create LLM instance based on config
-    llm = create_llm()
+    if llm is None:
+        llm = create_llm()
+    
+    # Analyze upcoming groups in the background
+    queue: asyncio.Queue = asyncio.Queue(maxsize=PREFETCH_DEPTH)
+    stop = threading.Event()
+    prefetcher = asyncio.create_task(
+        _prefetch_groups(error_groups, group_contexts, source_dir, llm, queue, stop)
+    )
     
-    # Process each error GROUP
-    for i, error_group in enumerate(error_groups, 1):
-        # Get the primary error (first in group) for display
-        primary_error = error_group[0]
-        
-        console.rule(f"[bold]Issue {i}/{len(error_groups)} - {primary_error.source_file}:{primary_error.function_name}[/bold]")
-        
-        # Show all errors in this group
-        console.print(f"\n[bold yellow]📌 {len(error_group)} related error(s) in this group:[/bold yellow]")
-        for error in error_group:
-            level_color = "red" if error.is_critical() else "yellow"
-            console.print(f"  [{level_color}]{error.level}[/{level_color}] {error.source_file}:{error.line_number} - {error.message[:60]}...")
-        console.print()
-        
-        # Get full context (all log entries from affected threads)
-        context_entries = get_full_context_for_group(entries, error_group)
-        
-        console.print(f"[dim]Analyzing with {len(context_entries)} context log entries...[/dim]\n")
-        
-        # Analyze the PRIMARY error but with ALL context
-        with console.status("[bold cyan]Analyzing error group with AI...[/bold cyan]"):
-            try:
-                # Send all context for better understanding
-                report = analyze_error_sync(primary_error, context_entries, source_dir, llm)
-                
-                # Update the report to mention all related errors
-                if len(error_group) > 1:
-                    report.root_cause = f"[Group of {len(error_group)} related errors]\n\n{report.root_cause}"
-            except Exception as e:
-                console.print(f"[red]Error during analysis: {e}[/red]")
+    try:
+        # Process each error GROUP
+        for i, error_group in enumerate(error_groups, 1):
+            # Get the primary error (first in group) for display
+            primary_error = error_group[0]
+            
+            console.rule(f"[bold]Issue {i}/{len(error_groups)} - {primary_error.source_file}:{primary_error.function_name}[/bold]")
+            
+            # Show all errors in this group (one write for the whole list)
+            group_lines = [f"\n[bold yellow]📌 {len(error_group)} related error(s) in this group:[/bold yellow]"]
+            group_lines.extend(
+                f"  [{'red' if error.is_critical() else 'yellow'}]{error.level}[/] "
+                f"{error.source_file}:{error.line_number} - {error.message[:60]}..."
+                for error in error_group
+            )
+            group_lines.append("")
+            console.print("\n".join(group_lines))
+            
+            # Get full context (all log entries from affected threads)
+            context_entries, task = await queue.get()
+            
+            console.print(f"[dim]Analyzing with {len(context_entries)} context log entries...[/dim]\n")
+            
+            with console.status("[bold cyan]Analyzing error group with AI...[/bold cyan]"):
+                report, fix, failure = await task
+            
+            if report is None:
+                console.print(f"[red]{failure}[/red]")
                 continue
-        
-        display_error_report(report)
-        
-        # Generate fix
-        with console.status("[bold blue]Generating fix proposal...[/bold blue]"):
-            try:
-                fix = generate_fix_sync(report, source_dir, llm)
-            except Exception as e:
-                console.print(f"[red]Error generating fix: {e}[/red]")
+            
+            display_error_report(report)
+            
+            if fix is None:
+                console.print(f"[red]{failure}[/red]")
                 continue
-        
-        console.print()
-        display_fix_proposal(fix)
-        
-        # Ask for confirmation
-        console.print()
-        if dry_run:
-            console.print("[dim]Dry run mode - skipping PR creation[/dim]")
-            if not Confirm.ask("Continue to next issue?", default=True):
-                break
-            continue
-        
-        if fix.requires_pr and config.has_github_access:
-            if Confirm.ask("[bold]Create a PR with this fix?[/bold]", default=False):
-                with console.status("[bold green]Creating GitHub PR...[/bold green]"):
-                    try:
-                        gh = GitHubIntegration(
-                            token=config.github_token,
-                            repo_name=config.github_repo,
-                            target_branch=config.github_target_branch
-                        )
-                        
-                        from datetime import datetime
-                        branch_name = f"fix/auto-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-                        gh.create_branch(branch_name)
-                        
-                        files_updated = 0
-                        for change in fix.code_changes:
-                            try:
-                                # Try to update file on GitHub (path is relative to repo root)
-                                new_content = change.new_code  # Use the LLM's suggested new code
-                                gh.update_file(
-                                    file_path=change.file_path,
-                                    new_content=new_content,
-                                    branch=branch_name,
-                                    commit_message=f"fix: {change.explanation}"
-                                )
-                                files_updated += 1
-                            except Exception as file_err:
-                                console.print(f"[yellow]⚠️ Could not update {change.file_path}: {file_err}[/yellow]")
-                        
-                        if files_updated == 0:
-                            console.print("[red]❌ No files were updated - cannot create PR[/red]")
-                            console.print("[dim]The file paths from the fix may not exist in the GitHub repo.[/dim]")
-                            continue
-                        
-                        pr_url = gh.create_pull_request(
-                            title=fix.title,
-                            body=fix.get_pr_body(),
-                            head_branch=branch_name
-                        )
-                        
-                        console.print(f"\n[bold green]✅ PR created successfully![/bold green]")
-                        console.print(f"[link={pr_url}]{pr_url}[/link]\n")
-                    except Exception as e:
-                        console.print(f"[red]Failed to create PR: {e}[/red]")
-        else:
-            if not fix.requires_pr:
-                console.print("[yellow]This fix requires manual steps (not a code change)[/yellow]")
-            elif not config.has_github_access:
-                console.print("[yellow]GitHub access not configured - cannot create PR[/yellow]")
-        
-        # Continue to next issue?
-        if i < len(error_groups):
-            if not Confirm.ask("\nContinue to next issue?", default=True):
-                break
+            
+            console.print()
+            display_fix_proposal(fix)
+            
+            # Ask for confirmation
+            console.print()
+            if dry_run:
+                console.print("[dim]Dry run mode - skipping PR creation[/dim]")
+                if not await _confirm("Continue to next issue?", default=True):
+                    break
+                continue
+            
+            if fix.requires_pr and config.has_github_access:
+                if await _confirm("[bold]Create a PR with this fix?[/bold]", default=False):
+                    with console.status("[bold green]Creating GitHub PR...[/bold green]"):
+                        try:
+                            await _create_pr_for_fix(fix, config)
+                        except Exception as e:
+                            console.print(f"[red]Failed to create PR: {e}[/red]")
+            else:
+                if not fix.requires_pr:
+                    console.print("[yellow]This fix requires manual steps (not a code change)[/yellow]")
+                elif not config.has_github_access:
+                    console.print("[yellow]GitHub access not configured - cannot create PR[/yellow]")
+            
+            # Continue to next issue?
+            if i < len(error_groups):
+                if not await _confirm("\nContinue to next issue?", default=True):
+                    break
+    finally:
+        # Drop any analyses the user no longer needs; in-flight worker
+        # threads finish their current call but start no new LLM calls,
+        # so asyncio.run doesn't wait on a backlog of analyses at exit
+        stop.set()
+        prefetcher.cancel()
+        while not queue.empty():
+            _, task = queue.get_nowait()
+            task.cancel()
     
     console.print("\n[bold green]✅ Analysis complete![/bold green]\n")
 
 
+def run_interactive_analysis(
+    log_content: str,
+    source_dir: Path,
+    repo_root: Path,
+    dry_run: bool = False
+) -> None:
+    """
+    Run interactive analysis on log content.
+    
+    Synchronous entry point for run_interactive_analysis_async.
+    """
+    asyncio.run(run_interactive_analysis_async(log_content, source_dir, repo_root, dry_run))
+
+
+def _read_log_input(log_input: str) -> str:
+    """
+    Get log content from the CLI input.
+    
+    Returns the file content if log_input is an existing path,
+    otherwise log_input itself is treated as raw log content.
+    """
+    log_path = Path(log_input)
+    if log_path.exists():
+        console.print(f"[dim]Loading log file: {log_path}[/dim]")
+        return log_path.read_text(encoding='utf-8', errors='replace')
+    return log_input
+
+
+async def _analyze_interactive(
+    log_input: str,
+    source_dir: Path,
+    repo_root: Path,
+    dry_run: bool
+) -> None:
+    """
+    Read the log and create the LLM client concurrently, then run
+    the interactive analysis.
+    """
+    config = get_config()
+    read_log = asyncio.to_thread(_read_log_input, log_input)
+    
+    if config.is_configured:
+        log_content, llm = await asyncio.gather(read_log, asyncio.to_thread(create_llm))
+    else:
+        # Let the analysis report the missing configuration
+        log_content, llm = await read_log, None
+    
+    await run_interactive_analysis_async(log_content, source_dir, repo_root, dry_run, llm=llm)
+
+
 @app.command()
 def analyze(
     log_input: str = typer.Argument(
@@ -331,21 +537,14 @@ def analyze(
         border_style="cyan"
     ))
     
-    # Determine if input is file path or content
-    log_path = Path(log_input)
-    if log_path.exists():
-        console.print(f"[dim]Loading log file: {log_path}[/dim]")
-        log_content = log_path.read_text(encoding='utf-8', errors='replace')
-    else:
-        log_content = log_input
-    
     source_path = Path(source_dir)
     repo_path = Path(repo_root)
     
     if interactive:
-        run_interactive_analysis(log_content, source_path, repo_path, dry_run)
+        asyncio.run(_analyze_interactive(log_input, source_path, repo_path, dry_run))
     else:
         # Batch mode - just list errors
+        log_content = _read_log_input(log_input)
         entries = parse_log_content(log_content)
         errors = extract_errors(entries)
         
@@ -360,15 +559,19 @@ def analyze(
         table.add_column("Function")
         table.add_column("Message", max_width=50)
         
-        for error in errors:
-            level_style = "red" if error.is_critical() else "yellow"
-            table.add_row(
-                f"[{level_style}]{error.level}[/{level_style}]",
+        # Build all rows first; the table is rendered in a single print
+        rows = [
+            (
+                f"[{'red' if error.is_critical() else 'yellow'}]{error.level}[/]",
                 error.source_file,
                 str(error.line_number),
                 error.function_name,
-                error.message[:50] + "..." if len(error.message) > 50 else error.message
+                f"{error.message[:50]}..." if len(error.message) > 50 else error.message,
             )
+            for error in errors
+        ]
+        for row in rows:
+            table.add_row(*row)
         
         console.print(table)
 
@@ -430,6 +633,8 @@ def setup():
 
 def main():
     """Entry point for the CLI."""
+    if uvloop is not None and sys.platform != "win32":
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     app()
 
 
@@ -1,12 +1,13 @@
 # Agent models package
 from .log_entry import LogEntry
-from .error_report import ErrorReport, ErrorType
+from .error_report import ErrorReport, ErrorType, ERROR_TYPE_NAMES
 from .fix_proposal import FixProposal, FixType
 
 __all__ = [
     "LogEntry",
     "ErrorReport",
     "ErrorType",
+    "ERROR_TYPE_NAMES",
     "FixProposal",
     "FixType",
 ]
@@ -5,26 +5,30 @@ Represents the analysis result of an error from the logs.
 """
 
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from typing import List, Optional
 
 from .log_entry import LogEntry
 
 
-class ErrorType(Enum):
+class ErrorType(IntEnum):
     """Classification of error types."""
-    CODE_BUG = "code_bug"                    # Logic error in code
-    STRING_HANDLING = "string_handling"       # String/substring errors
-    NULL_POINTER = "null_pointer"             # Null/empty checks missing
-    MISSING_CONFIG = "missing_config"         # Configuration not found
-    MISSING_DATA = "missing_data"             # Database/cache record not found
-    DATABASE_ERROR = "database_error"         # DB operation failed
-    CACHE_ERROR = "cache_error"               # Redis/cache operation failed
-    EXTERNAL_SERVICE = "external_service"     # External service failure
-    UNKNOWN = "unknown"                       # Could not classify
+    CODE_BUG = 0                  # Logic error in code
+    STRING_HANDLING = 1           # String/substring errors
+    NULL_POINTER = 2              # Null/empty checks missing
+    MISSING_CONFIG = 3            # Configuration not found
+    MISSING_DATA = 4              # Database/cache record not found
+    DATABASE_ERROR = 5            # DB operation failed
+    CACHE_ERROR = 6               # Redis/cache operation failed
+    EXTERNAL_SERVICE = 7          # External service failure
+    UNKNOWN = 8                   # Could not classify
 
 
-@dataclass
+# Display/prompt names indexed by ErrorType (e.g. "code_bug")
+ERROR_TYPE_NAMES: tuple[str, ...] = tuple(t.name.lower() for t in ErrorType)
+
+
+@dataclass(slots=True)
 class ErrorReport:
     """
     Represents the analysis of an error extracted from logs.
@@ -77,7 +81,7 @@ class ErrorReport:
     def to_summary(self) -> str:
         """Get a brief summary of the error."""
         return (
-            f"[{self.severity}] {self.error_type.value} in {self.affected_file}:{self.affected_line}\n"
+            f"[{self.severity}] {ERROR_TYPE_NAMES[self.error_type]} in {self.affected_file}:{self.affected_line}\n"
             f"Message: {self.primary_error.message}\n"
             f"Root Cause: {self.root_cause}"
         )
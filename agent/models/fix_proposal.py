@@ -19,7 +19,7 @@ class FixType(Enum):
     MULTIPLE = "multiple"                 # Combination of fixes
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeChange:
     """Represents a single code change in a file."""
     file_path: str              # Relative path to file (e.g., "src/translator.cpp")
@@ -30,7 +30,7 @@ class CodeChange:
     explanation: str            # Why this change fixes the issue
 
 
-@dataclass
+@dataclass(slots=True)
 class FixProposal:
     """
     Represents a proposed fix for an error.
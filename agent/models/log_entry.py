@@ -8,13 +8,21 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+# Levels that count as errors
+ERROR_LEVELS = frozenset({"ERROR", "CRITICAL"})
+
+
+@dataclass(slots=True)
 class LogEntry:
     """
     Represents a single log entry parsed from log files.
     
     Log format: Time \t Level \t FileName \t LineNumber \t FunctionName \t ThreadID Message
     Example: 17:13:30.548 	INFO 	translator.cpp     	0078 	ProcessIncomin 	58197610545000 STEP1: Message fields parsed
+    
+    Slotted so large logs don't pay for a __dict__ per entry. Not frozen:
+    frozen dataclasses set every field through object.__setattr__, which
+    makes construction several times slower during parsing.
     """
     
     timestamp: str          # "17:13:30.548"
@@ -28,7 +36,7 @@ class LogEntry:
     
     def is_error(self) -> bool:
         """Check if this log entry represents an error."""
-        return self.level in ("ERROR", "CRITICAL")
+        return self.level in ERROR_LEVELS
     
     def is_critical(self) -> bool:
         """Check if this is a critical error."""
@@ -4,63 +4,99 @@ Error Analyzer Node for LangGraph.
 Uses Gemini or Groq LLM to analyze errors and classify them.
 """
 
-import json
+import asyncio
+import contextlib
+import functools
+import os
+import re
+import threading
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Any
-
-from langchain_core.messages import HumanMessage, SystemMessage
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping
 
 from ..models.log_entry import LogEntry
 from ..models.error_report import ErrorReport, ErrorType
 from ..prompts.analyzer_prompt import ANALYZER_SYSTEM_PROMPT, get_analyzer_prompt
 from ..utils.config import get_config
-from .log_parser import group_related_entries
+from ..utils.llm_cache import invoke_cached, ainvoke_cached
+from .log_parser import ContextIndex, group_related_entries
+
+
+# Matches #include "file.h" (group 1) and #include <file.h> (group 2)
+# as preprocessor directives only (start of line, "# include" allowed),
+# so includes mentioned in comments or strings are skipped
+_INCLUDE_RE = re.compile(r'^[ \t]*#[ \t]*include[ \t]*(?:"([^"]+)"|<([^>]+)>)', re.MULTILINE)
+
+# Standard library headers, never fetched from the repository
+_STD_HEADERS = frozenset({
+    # C++ standard library
+    'algorithm', 'any', 'array', 'atomic', 'bitset', 'chrono', 'condition_variable',
+    'deque', 'exception', 'filesystem', 'fstream', 'functional', 'future',
+    'iomanip', 'ios', 'iosfwd', 'iostream', 'istream', 'iterator', 'limits',
+    'list', 'map', 'memory', 'mutex', 'numeric', 'optional', 'ostream', 'queue',
+    'random', 'ratio', 'regex', 'set', 'shared_mutex', 'sstream', 'stack',
+    'stdexcept', 'streambuf', 'string', 'string_view', 'system_error', 'thread',
+    'tuple', 'type_traits', 'typeinfo', 'unordered_map', 'unordered_set',
+    'utility', 'variant', 'vector',
+    # C library (C++ and C spellings)
+    'cassert', 'cctype', 'cerrno', 'cfloat', 'climits', 'cmath', 'csignal',
+    'cstdarg', 'cstddef', 'cstdint', 'cstdio', 'cstdlib', 'cstring', 'ctime',
+    'assert.h', 'ctype.h', 'errno.h', 'limits.h', 'math.h', 'signal.h',
+    'stdarg.h', 'stddef.h', 'stdint.h', 'stdio.h', 'stdlib.h', 'string.h',
+    'time.h', 'unistd.h', 'pthread.h', 'stdc++.h',
+})
+
+
+# GitHub source lookups in progress, by (source_file, max_includes)
+_source_fetches: dict[tuple[str, int], Future] = {}
+_source_fetches_lock = threading.Lock()
 
 
 def create_llm():
-    """Create the LLM instance based on configuration."""
+    """
+    Create the LLM instance based on configuration.
+    
+    The client is shared by all callers and only rebuilt when the
+    provider settings change.
+    """
     config = get_config()
     
     if config.llm_provider == "groq":
+        return _create_llm_client(
+            "groq", config.groq_model, config.groq_api_key, config.temperature
+        )
+    return _create_llm_client(
+        "gemini", config.gemini_model, config.google_api_key, config.temperature
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _create_llm_client(
+    provider: str,
+    model: str,
+    api_key: str,
+    temperature: float
+):
+    """Build the LLM client for the given provider settings."""
+    if provider == "groq":
         from langchain_groq import ChatGroq
         return ChatGroq(
-            model=config.groq_model,
-            api_key=config.groq_api_key,
-            temperature=config.temperature
+            model=model,
+            api_key=api_key,
+            temperature=temperature
         )
     else:
         from langchain_google_genai import ChatGoogleGenerativeAI
         return ChatGoogleGenerativeAI(
-            model=config.gemini_model,
-            google_api_key=config.google_api_key,
-            temperature=config.temperature
+            model=model,
+            google_api_key=api_key,
+            temperature=temperature
         )
 
 
-def _get_source_from_github(source_file: str) -> str | None:
-    """
-    Fetch source code from the configured GitHub repository via MCP.
-    
-    Args:
-        source_file: Filename from the log (e.g., "translator.cpp")
-    
-    Returns:
-        Source code content or None if not found
-    """
-    from ..utils.mcp_client import get_file_contents_sync
-    
-    config = get_config()
-    
-    if not config.has_github_access:
-        return None
-    
-    # Parse owner/repo from config
-    try:
-        owner, repo = config.github_repo.split("/")
-    except ValueError:
-        print(f"⚠️ Invalid GITHUB_REPO format: {config.github_repo}")
-        return None
-    
+def _candidate_paths(source_file: str) -> list[str]:
+    """Get the repository paths to try for a file named in the logs, in order."""
     # Try different path patterns
     possible_paths = [
         f"src/{source_file}",           # src/translator.cpp
@@ -77,18 +113,62 @@ def _get_source_from_github(source_file: str) -> str | None:
             f"src/{base_name}.h",
         ])
     
-    for path in possible_paths:
-        content = get_file_contents_sync(
-            owner=owner,
-            repo=repo,
-            path=path,
-            branch=config.github_target_branch
+    return possible_paths
+
+
+async def _get_sources_from_github_async(source_files: list[str]) -> dict[str, str]:
+    """
+    Fetch several source files from the configured GitHub repository via MCP.
+    
+    Candidate paths are probed in rounds: each round fetches the next
+    candidate of every file not found yet in one concurrent batch, so
+    the request count matches probing one file at a time but the
+    latency is one round-trip per round.
+    
+    Args:
+        source_files: Filenames from the log or from #include lines
+    
+    Returns:
+        Source code content by filename, for the files that were found
+    """
+    config = get_config()
+    
+    if not config.has_github_access or not source_files:
+        return {}
+    
+    # Parse owner/repo from config
+    try:
+        owner, repo = config.github_repo.split("/")
+    except ValueError:
+        print(f"⚠️ Invalid GITHUB_REPO format: {config.github_repo}")
+        return {}
+    
+    from ..utils.mcp_client import get_files_contents_async
+    
+    found: dict[str, str] = {}
+    pending = {source_file: iter(_candidate_paths(source_file)) for source_file in source_files}
+    
+    while pending:
+        batch = []
+        for source_file, paths in list(pending.items()):
+            path = next(paths, None)
+            if path is None:
+                del pending[source_file]
+            else:
+                batch.append((source_file, path))
+        if not batch:
+            break
+        
+        contents = await get_files_contents_async(
+            owner, repo, [path for _, path in batch], config.github_target_branch
         )
-        if content:
-            print(f"📄 Loaded source from GitHub via MCP: {path}")
-            return content
+        for (source_file, path), content in zip(batch, contents):
+            if content:
+                print(f"📄 Loaded source from GitHub via MCP: {path}")
+                found[source_file] = content
+                del pending[source_file]
     
-    return None
+    return found
 
 
 def _parse_includes(source_code: str) -> list[str]:
@@ -101,32 +181,27 @@ def _parse_includes(source_code: str) -> list[str]:
     Returns:
         List of included file names (without path, just filename)
     """
-    import re
-    
-    includes = []
-    
-    # Match both #include "file.h" and #include <file.h>
-    # We focus on local includes ("") as they're more likely to be in the repo
-    patterns = [
-        r'#include\s*"([^"]+)"',  # #include "file.h"
-        r'#include\s*<([^>]+)>',  # #include <file.h> (less likely to be local)
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, source_code)
-        for match in matches:
-            # Extract just the filename, not the path
-            filename = match.split('/')[-1]
-            if filename not in includes:
-                includes.append(filename)
-    
-    return includes
+    # Local ("") includes come first as they're more likely to be in the repo
+    local = []
+    system = []
+    for quoted, angled in _INCLUDE_RE.findall(source_code):
+        if quoted:
+            local.append(quoted)
+        else:
+            system.append(angled)
+    
+    # Extract just the filename, not the path, dropping duplicates
+    return list(dict.fromkeys(match.split('/')[-1] for match in local + system))
 
 
 def _get_source_with_includes(source_file: str, max_includes: int = 5) -> str | None:
     """
     Fetch source code along with its included files for better context.
     
+    Concurrent calls for the same file (from threads or event loops)
+    share one fetch: the first caller fetches, the others wait for its
+    result. Later calls are served from the MCP client's file cache.
+    
     Args:
         source_file: Main source file from the log
         max_includes: Maximum number of included files to fetch (to limit API calls)
@@ -134,8 +209,72 @@ def _get_source_with_includes(source_file: str, max_includes: int = 5) -> str |
     Returns:
         Combined source code with main file and includes, or None if not found
     """
+    if not get_config().has_github_access:
+        return None
+    
+    key = (source_file, max_includes)
+    future, is_owner = _claim_source_fetch(key)
+    if not is_owner:
+        return future.result()
+    
+    from ..utils.mcp_client import run_sync
+    
+    with _publish_source_fetch(key, future):
+        result = run_sync(_fetch_source_with_includes_async(source_file, max_includes))
+        future.set_result(result)
+        return result
+
+
+async def _get_source_with_includes_async(source_file: str, max_includes: int = 5) -> str | None:
+    """Async version of _get_source_with_includes; waits without blocking the loop."""
+    if not get_config().has_github_access:
+        return None
+    
+    key = (source_file, max_includes)
+    future, is_owner = _claim_source_fetch(key)
+    if not is_owner:
+        return await asyncio.wrap_future(future)
+    
+    from ..utils.mcp_client import run_on_mcp_loop
+    
+    with _publish_source_fetch(key, future):
+        result = await run_on_mcp_loop(_fetch_source_with_includes_async(source_file, max_includes))
+        future.set_result(result)
+        return result
+
+
+def _claim_source_fetch(key: tuple[str, int]) -> tuple[Future, bool]:
+    """
+    Get the in-flight fetch for key, registering a new one if there is none.
+    
+    Returns:
+        Tuple of (future for the result, whether the caller must fetch it)
+    """
+    with _source_fetches_lock:
+        future = _source_fetches.get(key)
+        if future is not None:
+            return future, False
+        future = _source_fetches[key] = Future()
+        return future, True
+
+
+@contextlib.contextmanager
+def _publish_source_fetch(key: tuple[str, int], future: Future) -> Iterator[None]:
+    """Pass a failed fetch's exception to waiters, then unregister the fetch."""
+    try:
+        yield
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _source_fetches_lock:
+            del _source_fetches[key]
+
+
+async def _fetch_source_with_includes_async(source_file: str, max_includes: int) -> str | None:
+    """Fetch a source file and its repository includes from GitHub."""
     # Get the main source file
-    main_content = _get_source_from_github(source_file)
+    main_content = (await _get_sources_from_github_async([source_file])).get(source_file)
     
     if not main_content:
         return None
@@ -146,29 +285,77 @@ def _get_source_with_includes(source_file: str, max_includes: int = 5) -> str |
     if not includes:
         return main_content
     
-    # Build combined content with main file first
-    combined_parts = [
-        f"// ===== MAIN FILE: {source_file} =====",
-        main_content,
+    # Skip standard headers (not in repo), then limit to prevent too many API calls
+    repo_includes = [name for name in includes if name not in _STD_HEADERS][:max_includes]
+    
+    # Fetch all includes in concurrent batches, keeping include order
+    contents = await _get_sources_from_github_async(repo_includes)
+    fetched = [
+        (include_file, contents[include_file])
+        for include_file in repo_includes
+        if include_file in contents
     ]
     
-    # Fetch included files (limit to prevent too many API calls)
-    fetched_count = 0
-    for include_file in includes[:max_includes]:
-        # Skip system headers (likely not in repo)
-        if include_file.startswith(('std', 'cstd', 'iostream', 'string', 'vector', 'map')):
-            continue
-        
-        include_content = _get_source_from_github(include_file)
-        if include_content:
-            combined_parts.append(f"\n\n// ===== INCLUDED FILE: {include_file} =====")
-            combined_parts.append(include_content)
-            fetched_count += 1
+    if fetched:
+        print(f"📎 Also loaded {len(fetched)} included file(s)")
     
-    if fetched_count > 0:
-        print(f"📎 Also loaded {fetched_count} included file(s)")
+    # Combined content with main file first
+    return "\n".join(_iter_source_sections(source_file, main_content, fetched))
+
+
+def _iter_source_sections(
+    source_file: str,
+    main_content: str,
+    includes: list[tuple[str, str]]
+) -> Iterator[str]:
+    """
+    Yield the labelled sections of combined source content.
     
-    return "\n".join(combined_parts)
+    Args:
+        source_file: Main source file name
+        main_content: Main source file content
+        includes: (file name, content) pairs of fetched includes
+    """
+    yield f"// ===== MAIN FILE: {source_file} =====\n{main_content}"
+    for include_file, include_content in includes:
+        yield f"\n// ===== INCLUDED FILE: {include_file} =====\n{include_content}"
+
+
+def _list_source_dir(source_dir: Path) -> dict[str, Path]:
+    """
+    List the files in a source directory, by name.
+    
+    The scan is reused until the directory's mtime changes (a file is
+    added, removed or renamed), so lookups are dict hits instead of
+    stat() calls and rescans.
+    """
+    try:
+        mtime_ns = source_dir.stat().st_mtime_ns
+    except OSError:
+        return {}
+    return _scan_source_dir(str(source_dir), mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _scan_source_dir(source_dir: str, mtime_ns: int) -> dict[str, Path]:
+    """Scan a source directory; the mtime in the key invalidates stale listings."""
+    try:
+        with os.scandir(source_dir) as it:
+            return {entry.name: Path(entry.path) for entry in it if entry.is_file()}
+    except OSError:
+        return {}
+
+
+@functools.lru_cache(maxsize=128)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a source file; the stat fields in the key invalidate stale entries."""
+    return Path(path).read_text(encoding='utf-8', errors='replace')
+
+
+def _read_source_file(file_path: Path) -> str:
+    """Read a local source file, reusing the text if it hasn't changed."""
+    st = file_path.stat()
+    return _read_text_cached(str(file_path), st.st_mtime_ns, st.st_size)
 
 
 def _get_source_code(source_file: str, source_dir: Path) -> str | None:
@@ -176,6 +363,8 @@ def _get_source_code(source_file: str, source_dir: Path) -> str | None:
     Load source code for the given file.
     
     First tries to fetch from GitHub (with includes), then falls back to local filesystem.
+    Not memoized itself: the directory listing and file reads are cached
+    by mtime, so a file edited or added mid-run is picked up.
     
     Args:
         source_file: Filename from the log (e.g., "translator.cpp")
@@ -189,133 +378,118 @@ def _get_source_code(source_file: str, source_dir: Path) -> str | None:
     if github_content:
         return github_content
     
-    # Fallback to local filesystem (no include parsing for local files)
+    return _get_local_source_code(source_file, source_dir)
+
+
+async def _get_source_code_async(source_file: str, source_dir: Path) -> str | None:
+    """Async version of _get_source_code; GitHub fetches don't block the loop."""
+    github_content = await _get_source_with_includes_async(source_file)
+    if github_content:
+        return github_content
+    
+    return await asyncio.to_thread(_get_local_source_code, source_file, source_dir)
+
+
+def _get_local_source_code(source_file: str, source_dir: Path) -> str | None:
+    """Find a source file in the local source directory (no include parsing)."""
     possible_names = [
         source_file,
         source_file.replace('.cpp', ''),
         source_file.replace('.h', ''),
     ]
     
+    files = _list_source_dir(source_dir)
+    
     for name in possible_names:
         # Check direct match
-        for ext in ['.cpp', '.h', '']:
-            file_path = source_dir / f"{name}{ext}"
-            if file_path.exists():
-                return file_path.read_text(encoding='utf-8', errors='replace')
+        for ext in ('.cpp', '.h', ''):
+            file_path = files.get(f"{name}{ext}")
+            if file_path is not None:
+                return _read_source_file(file_path)
         
         # Also check for partial matches (logs often truncate names)
-        if source_dir.exists():
-            for file in source_dir.glob('*'):
-                if file.is_file() and name in file.name:
-                    return file.read_text(encoding='utf-8', errors='replace')
+        for file_name, file_path in files.items():
+            if name in file_name and not file_name.startswith('.'):
+                return _read_source_file(file_path)
     
     return None
 
 
-def _parse_llm_response(response: str) -> dict:
-    """
-    Parse JSON response from LLM, handling potential formatting issues.
-    
-    Args:
-        response: Raw LLM response string
-    
-    Returns:
-        Parsed dictionary
-    """
-    # Try to extract JSON from the response
-    text = response.strip()
-    
-    # Remove markdown code blocks if present
-    if text.startswith('```json'):
-        text = text[7:]
-    elif text.startswith('```'):
-        text = text[3:]
-    
-    if text.endswith('```'):
-        text = text[:-3]
-    
-    text = text.strip()
-    
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        # Try to find JSON in the response
-        import re
-        json_match = re.search(r'\{[^{}]*\}', text, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError:
-                pass
-        
-        # Return default if parsing fails
-        return {
-            "error_type": "unknown",
-            "is_code_issue": True,
-            "root_cause": "Failed to parse LLM response",
-            "suggested_approach": "Manual analysis required",
-            "confidence": 0.0
-        }
+# Result used when the analysis response can't be parsed (shared, read-only)
+_ANALYSIS_PARSE_FAILURE = MappingProxyType({
+    "error_type": "unknown",
+    "is_code_issue": True,
+    "root_cause": "Failed to parse LLM response",
+    "suggested_approach": "Manual analysis required",
+    "confidence": 0.0
+})
+
+
+# LLM error type strings (lowercase) to ErrorType
+_ERROR_TYPE_MAP = {
+    "code_bug": ErrorType.CODE_BUG,
+    "string_handling": ErrorType.STRING_HANDLING,
+    "null_pointer": ErrorType.NULL_POINTER,
+    "missing_config": ErrorType.MISSING_CONFIG,
+    "missing_data": ErrorType.MISSING_DATA,
+    "database_error": ErrorType.DATABASE_ERROR,
+    "cache_error": ErrorType.CACHE_ERROR,
+    "external_service": ErrorType.EXTERNAL_SERVICE,
+}
 
 
 def _error_type_from_string(error_type_str: str) -> ErrorType:
     """Convert string error type to ErrorType enum."""
-    mapping = {
-        "code_bug": ErrorType.CODE_BUG,
-        "string_handling": ErrorType.STRING_HANDLING,
-        "null_pointer": ErrorType.NULL_POINTER,
-        "missing_config": ErrorType.MISSING_CONFIG,
-        "missing_data": ErrorType.MISSING_DATA,
-        "database_error": ErrorType.DATABASE_ERROR,
-        "cache_error": ErrorType.CACHE_ERROR,
-        "external_service": ErrorType.EXTERNAL_SERVICE,
-    }
-    return mapping.get(error_type_str.lower(), ErrorType.UNKNOWN)
+    return _ERROR_TYPE_MAP.get(error_type_str.lower(), ErrorType.UNKNOWN)
 
 
-async def analyze_error_async(
+def _build_analysis_request(
     error_entry: LogEntry,
     all_entries: list[LogEntry],
-    source_dir: Path,
-    llm: Any
-) -> ErrorReport:
+    source_code: str | None,
+    context_index: ContextIndex | None
+) -> tuple[list[LogEntry], list]:
     """
-    Analyze a single error entry using the LLM.
+    Gather log context for an error and build the analyzer messages.
     
-    Args:
-        error_entry: The error log entry to analyze
-        all_entries: All log entries for context
-        source_dir: Path to source code directory
-        llm: The LLM instance to use
+    Shared by analyze_error_async and analyze_error_sync, which load
+    the source code themselves.
     
     Returns:
-        ErrorReport with analysis results
+        Tuple of (related entries, LLM messages)
     """
+    from langchain_core.messages import HumanMessage, SystemMessage
+    
     # Get related context entries
-    related = group_related_entries(all_entries, error_entry, context_lines=5)
+    if context_index is not None:
+        related = context_index.window(error_entry, context_lines=5)
+    else:
+        related = group_related_entries(all_entries, error_entry, context_lines=5)
     
     # Build log context string
     log_context = "\n".join(entry.to_context_string() for entry in related)
     
-    # Try to load relevant source code
-    source_code = _get_source_code(error_entry.source_file, source_dir)
-    
     # Build the prompt
     prompt = get_analyzer_prompt(
         error_logs=log_context,
         source_code=source_code
     )
     
-    # Call LLM
     messages = [
         SystemMessage(content=ANALYZER_SYSTEM_PROMPT),
         HumanMessage(content=prompt)
     ]
     
-    response = await llm.ainvoke(messages)
-    analysis = _parse_llm_response(response.content)
-    
-    # Build ErrorReport
+    return related, messages
+
+
+def _build_error_report(
+    error_entry: LogEntry,
+    related: list[LogEntry],
+    source_code: str | None,
+    analysis: Mapping[str, Any]
+) -> ErrorReport:
+    """Build an ErrorReport from the analyzer's parsed response."""
     return ErrorReport(
         primary_error=error_entry,
         related_entries=related,
@@ -328,50 +502,90 @@ async def analyze_error_async(
     )
 
 
+async def analyze_error_async(
+    error_entry: LogEntry,
+    all_entries: list[LogEntry],
+    source_dir: Path,
+    llm: Any,
+    context_index: ContextIndex | None = None
+) -> ErrorReport:
+    """
+    Analyze a single error entry using the LLM.
+    
+    Args:
+        error_entry: The error log entry to analyze
+        all_entries: All log entries for context
+        source_dir: Path to source code directory
+        llm: The LLM instance to use
+        context_index: Optional prebuilt index over all_entries
+    
+    Returns:
+        ErrorReport with analysis results
+    """
+    source_code = await _get_source_code_async(error_entry.source_file, source_dir)
+    related, messages = _build_analysis_request(
+        error_entry, all_entries, source_code, context_index
+    )
+    analysis = await ainvoke_cached(llm, messages, _ANALYSIS_PARSE_FAILURE)
+    return _build_error_report(error_entry, related, source_code, analysis)
+
+
 def analyze_error_sync(
     error_entry: LogEntry,
     all_entries: list[LogEntry],
     source_dir: Path,
-    llm: Any
+    llm: Any,
+    context_index: ContextIndex | None = None
 ) -> ErrorReport:
     """
     Synchronous version of error analysis.
     """
-    # Get related context entries
-    related = group_related_entries(all_entries, error_entry, context_lines=5)
-    
-    # Build log context string
-    log_context = "\n".join(entry.to_context_string() for entry in related)
-    
-    # Try to load relevant source code
     source_code = _get_source_code(error_entry.source_file, source_dir)
-    
-    # Build the prompt
-    prompt = get_analyzer_prompt(
-        error_logs=log_context,
-        source_code=source_code
+    related, messages = _build_analysis_request(
+        error_entry, all_entries, source_code, context_index
     )
+    analysis = invoke_cached(llm, messages, _ANALYSIS_PARSE_FAILURE)
+    return _build_error_report(error_entry, related, source_code, analysis)
+
+
+async def analyze_errors_batch_async(
+    errors: list[LogEntry],
+    all_entries: list[LogEntry],
+    source_dir: Path,
+    llm: Any,
+    max_concurrency: int | None = None,
+    context_index: ContextIndex | None = None
+) -> list[ErrorReport]:
+    """
+    Analyze several error entries concurrently.
     
-    # Call LLM
-    messages = [
-        SystemMessage(content=ANALYZER_SYSTEM_PROMPT),
-        HumanMessage(content=prompt)
-    ]
-    
-    response = llm.invoke(messages)
-    analysis = _parse_llm_response(response.content)
+    Args:
+        errors: The error log entries to analyze
+        all_entries: All log entries for context
+        source_dir: Path to source code directory
+        llm: The LLM instance to use
+        max_concurrency: Maximum in-flight LLM requests (defaults to config)
+        context_index: Prebuilt index over all_entries (built here if omitted)
     
-    # Build ErrorReport
-    return ErrorReport(
-        primary_error=error_entry,
-        related_entries=related,
-        error_type=_error_type_from_string(analysis.get("error_type", "unknown")),
-        is_code_issue=analysis.get("is_code_issue", True),
-        root_cause=analysis.get("root_cause", "Unknown"),
-        suggested_approach=analysis.get("suggested_approach", "Unknown"),
-        source_code_context=source_code,
-        confidence=float(analysis.get("confidence", 0.5))
-    )
+    Returns:
+        ErrorReports in the same order as errors
+    """
+    if max_concurrency is None:
+        max_concurrency = get_config().max_concurrency
+    # A limit below 1 would never let a request through
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    
+    # Index the log once for every error's context lookup
+    if context_index is None:
+        context_index = ContextIndex(all_entries)
+    
+    async def analyze(error_entry: LogEntry) -> ErrorReport:
+        async with semaphore:
+            return await analyze_error_async(
+                error_entry, all_entries, source_dir, llm, context_index
+            )
+    
+    return await asyncio.gather(*(analyze(error) for error in errors))
 
 
 def analyze_error_node(state: dict[str, Any]) -> dict[str, Any]:
@@ -384,9 +598,15 @@ def analyze_error_node(state: dict[str, Any]) -> dict[str, Any]:
         - current_error_index: int - Index of current error
         - source_dir: Path - Path to source code
         - llm: ChatGoogleGenerativeAI - LLM instance
+        - context_index: ContextIndex - Per-thread index of log_entries (optional)
+        - error_reports: List[ErrorReport] - Reports from an earlier batch (optional)
     
     Updates state with:
         - current_error_report: ErrorReport - Analysis of current error
+        - error_reports: List[ErrorReport] - Reports for all errors (first visit)
+    
+    On the first visit all remaining errors are analyzed concurrently;
+    later visits read their report from error_reports.
     """
     config = get_config()
     
@@ -396,12 +616,18 @@ def analyze_error_node(state: dict[str, Any]) -> dict[str, Any]:
     
     if index >= len(errors):
         return {
-            **state,
             "current_error_report": None,
             "analysis_complete": True
         }
     
-    current_error = errors[index]
+    # Serve from an earlier batch
+    reports = state.get("error_reports")
+    if reports and index < len(reports) and reports[index] is not None:
+        return {
+            "current_error_report": reports[index],
+            "analysis_complete": False
+        }
+    
     all_entries = state.get("log_entries", errors)
     
     # Get paths
@@ -412,12 +638,18 @@ def analyze_error_node(state: dict[str, Any]) -> dict[str, Any]:
     if llm is None:
         llm = create_llm()
     
-    # Analyze the error
-    report = analyze_error_sync(current_error, all_entries, source_dir, llm)
+    # Analyze this and all remaining errors in one concurrent batch
+    batch = asyncio.run(
+        analyze_errors_batch_async(
+            errors[index:], all_entries, source_dir, llm,
+            context_index=state.get("context_index")
+        )
+    )
+    reports = [None] * index + batch
     
+    # Only the changed keys are returned so the result can be cached
     return {
-        **state,
-        "current_error_report": report,
-        "llm": llm,
+        "current_error_report": reports[index],
+        "error_reports": reports,
         "analysis_complete": False
     }
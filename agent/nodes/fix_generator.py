@@ -4,65 +4,42 @@ Fix Generator Node for LangGraph.
 Generates fix proposals based on error analysis.
 """
 
-import json
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from langchain_core.messages import HumanMessage, SystemMessage
-
-from ..models.error_report import ErrorReport
+from ..models.error_report import ErrorReport, ERROR_TYPE_NAMES
 from ..models.fix_proposal import FixProposal, FixType, CodeChange
 from ..prompts.fix_generator_prompt import FIX_GENERATOR_SYSTEM_PROMPT, get_fix_generator_prompt
 from ..utils.config import get_config
+from ..utils.llm_cache import invoke_cached
 from .error_analyzer import create_llm
 
 
-def _parse_llm_response(response: str) -> dict:
-    """Parse JSON response from LLM."""
-    text = response.strip()
-    
-    # Remove markdown code blocks if present
-    if text.startswith('```json'):
-        text = text[7:]
-    elif text.startswith('```'):
-        text = text[3:]
-    
-    if text.endswith('```'):
-        text = text[:-3]
-    
-    text = text.strip()
-    
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        import re
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError:
-                pass
-        
-        return {
-            "title": "Unable to generate fix",
-            "description": "Failed to parse LLM response",
-            "risk_level": "high",
-            "confidence": 0.0,
-            "code_changes": [],
-            "manual_instructions": "Manual analysis required"
-        }
+# Result used when the fix response can't be parsed (shared, read-only)
+_FIX_PARSE_FAILURE = MappingProxyType({
+    "title": "Unable to generate fix",
+    "description": "Failed to parse LLM response",
+    "risk_level": "high",
+    "confidence": 0.0,
+    "code_changes": (),
+    "manual_instructions": "Manual analysis required"
+})
+
+
+# LLM fix type strings (lowercase) to FixType
+_FIX_TYPE_MAP = {
+    "code_change": FixType.CODE_CHANGE,
+    "config_change": FixType.CONFIG_CHANGE,
+    "data_insert": FixType.DATA_INSERT,
+    "data_update": FixType.DATA_UPDATE,
+    "multiple": FixType.MULTIPLE,
+}
 
 
 def _fix_type_from_string(fix_type_str: str) -> FixType:
     """Convert string to FixType enum."""
-    mapping = {
-        "code_change": FixType.CODE_CHANGE,
-        "config_change": FixType.CONFIG_CHANGE,
-        "data_insert": FixType.DATA_INSERT,
-        "data_update": FixType.DATA_UPDATE,
-        "multiple": FixType.MULTIPLE,
-    }
-    return mapping.get(fix_type_str.lower(), FixType.CODE_CHANGE)
+    return _FIX_TYPE_MAP.get(fix_type_str.lower(), FixType.CODE_CHANGE)
 
 
 def generate_fix_sync(
@@ -81,12 +58,16 @@ def generate_fix_sync(
     Returns:
         FixProposal with suggested fix
     """
+    from langchain_core.messages import HumanMessage, SystemMessage
+    
+    error_type = ERROR_TYPE_NAMES[error_report.error_type]
+    
     # Build analysis dict for prompt
     error_analysis = {
         "root_cause": error_report.root_cause,
         "suggested_approach": error_report.suggested_approach,
         "affected_function": error_report.primary_error.function_name,
-        "error_type": error_report.error_type.value
+        "error_type": error_type
     }
     
     # Get source code
@@ -98,7 +79,7 @@ def generate_fix_sync(
         error_analysis=error_analysis,
         source_code=source_code,
         file_path=file_path,
-        error_type=error_report.error_type.value,
+        error_type=error_type,
         is_code_issue=error_report.is_code_issue
     )
     
@@ -108,8 +89,7 @@ def generate_fix_sync(
         HumanMessage(content=prompt)
     ]
     
-    response = llm.invoke(messages)
-    fix_data = _parse_llm_response(response.content)
+    fix_data = invoke_cached(llm, messages, _FIX_PARSE_FAILURE)
     
     # Build CodeChange objects
     code_changes = []
@@ -162,7 +142,6 @@ def generate_fix_node(state: dict[str, Any]) -> dict[str, Any]:
     error_report = state.get("current_error_report")
     if error_report is None:
         return {
-            **state,
             "fix_proposal": None
         }
     
@@ -174,8 +153,7 @@ def generate_fix_node(state: dict[str, Any]) -> dict[str, Any]:
     
     fix = generate_fix_sync(error_report, source_dir, llm)
     
+    # Only the changed keys are returned so the result can be cached
     return {
-        **state,
-        "fix_proposal": fix,
-        "llm": llm
+        "fix_proposal": fix
     }
@@ -4,17 +4,21 @@ GitHub Integration Node for LangGraph.
 Handles creating branches, applying code changes, and creating PRs via MCP.
 """
 
+import asyncio
+import itertools
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
-from ..models.fix_proposal import FixProposal, CodeChange
+from ..models.fix_proposal import CodeChange
 from ..utils.config import get_config
 from ..utils.mcp_client import (
-    create_branch_sync,
-    push_files_sync,
-    create_pull_request_sync,
-    get_file_contents_sync,
+    create_branch_async,
+    push_files_async,
+    create_pull_request_async,
+    github_session,
+    run_sync,
 )
 
 
@@ -52,7 +56,11 @@ class GitHubIntegration:
         Returns:
             Full ref name of the created branch
         """
-        success = create_branch_sync(
+        return run_sync(self.create_branch_async(branch_name))
+    
+    async def create_branch_async(self, branch_name: str) -> str:
+        """Async version of create_branch."""
+        success = await create_branch_async(
             owner=self.owner,
             repo=self.repo,
             branch=branch_name,
@@ -87,28 +95,60 @@ class GitHubIntegration:
         Raises:
             Exception: If file update fails
         """
-        # Normalize path separators
-        file_path = file_path.replace("\\", "/")
+        return self.update_files(
+            files=[{"path": file_path, "content": new_content}],
+            branch=branch,
+            commit_message=commit_message
+        )
+    
+    def update_files(
+        self,
+        files: list[dict],
+        branch: str,
+        commit_message: str
+    ) -> bool:
+        """
+        Update several files in a single commit via MCP push_files.
         
-        # Remove leading ./ or / if present
-        if file_path.startswith("./"):
-            file_path = file_path[2:]
-        if file_path.startswith("/"):
-            file_path = file_path[1:]
+        Args:
+            files: List of {"path": str, "content": str} dicts
+            branch: Branch to commit to
+            commit_message: Commit message
+        
+        Returns:
+            True if successful
+        
+        Raises:
+            Exception: If the push fails
+        """
+        return run_sync(self.update_files_async(files, branch, commit_message))
+    
+    async def update_files_async(
+        self,
+        files: list[dict],
+        branch: str,
+        commit_message: str
+    ) -> bool:
+        """Async version of update_files."""
+        files = [
+            {"path": _normalize_repo_path(f["path"]), "content": f["content"]}
+            for f in files
+        ]
         
-        success = push_files_sync(
+        success = await push_files_async(
             owner=self.owner,
             repo=self.repo,
             branch=branch,
-            files=[{"path": file_path, "content": new_content}],
+            files=files,
             message=commit_message
         )
         
+        paths = ", ".join(f["path"] for f in files)
         if success:
-            print(f"✅ Updated {file_path} on branch {branch}")
+            print(f"✅ Updated {paths} on branch {branch}")
             return True
         else:
-            raise Exception(f"Failed to update file: {file_path}")
+            raise Exception(f"Failed to update file(s): {paths}")
     
     def create_pull_request(
         self,
@@ -129,7 +169,17 @@ class GitHubIntegration:
         Returns:
             URL of the created PR
         """
-        result = create_pull_request_sync(
+        return run_sync(self.create_pull_request_async(title, body, head_branch, labels))
+    
+    async def create_pull_request_async(
+        self,
+        title: str,
+        body: str,
+        head_branch: str,
+        labels: Optional[list[str]] = None
+    ) -> str:
+        """Async version of create_pull_request."""
+        result = await create_pull_request_async(
             owner=self.owner,
             repo=self.repo,
             title=title,
@@ -145,6 +195,81 @@ class GitHubIntegration:
             raise Exception("Failed to create pull request")
 
 
+_integrations: dict[tuple[str, str, str], GitHubIntegration] = {}
+_integrations_lock = threading.Lock()
+
+
+def get_github_integration(token: str, repo_name: str, target_branch: str = "main") -> GitHubIntegration:
+    """
+    Get a shared GitHubIntegration for the given repository settings.
+    
+    Args:
+        token: GitHub Personal Access Token (used by MCP server)
+        repo_name: Repository name in format "owner/repo"
+        target_branch: Branch to target for PRs
+    
+    Returns:
+        Cached GitHubIntegration instance
+    """
+    key = (token, repo_name, target_branch)
+    with _integrations_lock:
+        gh = _integrations.get(key)
+        if gh is None:
+            gh = GitHubIntegration(token, repo_name, target_branch)
+            _integrations[key] = gh
+    return gh
+
+
+# Per-process sequence number, so branch names created within the same
+# second can't collide (a collision fails create_branch)
+_branch_counter = itertools.count(1)
+
+
+# Results of PRs already opened in this process, keyed by _pr_key(), so
+# retrying an approved fix returns its PR instead of opening a duplicate.
+# Only successes are stored; a failed attempt is always retried.
+_created_prs: dict[tuple, dict[str, Any]] = {}
+_created_prs_lock = threading.Lock()
+
+
+def _pr_key(config: Any, repo_root: Path, fix_proposal: Any) -> tuple:
+    """Identify a PR by target repo, base branch, local root and fix content."""
+    return (
+        config.github_repo,
+        config.github_target_branch,
+        str(repo_root.resolve()),
+        fix_proposal.title,
+        tuple(
+            (change.file_path, change.original_code, change.new_code)
+            for change in fix_proposal.code_changes
+        ),
+    )
+
+
+def new_fix_branch_name() -> str:
+    """
+    Generate a unique branch name for an automated fix.
+    
+    Returns:
+        Branch name like "fix/auto-20250101-120000-1"
+    """
+    return f"fix/auto-{datetime.now():%Y%m%d-%H%M%S}-{next(_branch_counter)}"
+
+
+def _normalize_repo_path(file_path: str) -> str:
+    """Normalize a file path to be relative to the repository root."""
+    # Normalize path separators
+    file_path = file_path.replace("\\", "/")
+    
+    # Remove leading ./ or / if present
+    if file_path.startswith("./"):
+        file_path = file_path[2:]
+    if file_path.startswith("/"):
+        file_path = file_path[1:]
+    
+    return file_path
+
+
 def apply_code_change(
     file_path: Path,
     change: CodeChange
@@ -163,31 +288,47 @@ def apply_code_change(
         raise FileNotFoundError(f"File not found: {file_path}")
     
     content = file_path.read_text(encoding='utf-8')
-    lines = content.split('\n')
     
-    # Find the original code and replace it
+    # Find the original code and replace it; surrounding whitespace
+    # from the LLM is not part of the match
     original = change.original_code.strip()
     new = change.new_code
     
-    # Try exact replacement first
-    if original in content:
-        new_content = content.replace(original, new, 1)
-        return new_content
+    # Try exact replacement first, locating the first match once
+    index = content.find(original)
+    if index >= 0:
+        return content[:index] + new + content[index + len(original):]
     
     # If exact match fails, try line-based replacement
     if change.line_start > 0 and change.line_end > 0:
-        # Replace lines in the range
-        start_idx = change.line_start - 1  # Convert to 0-indexed
-        end_idx = change.line_end  # Exclusive end
+        # Replace the lines in the range, slicing at line offsets
+        # instead of splitting the whole file into lines
+        start = _line_offset(content, change.line_start - 1)  # 0-indexed
+        end = _line_offset(content, change.line_end)  # Exclusive end
         
-        # Replace the lines
-        new_lines = lines[:start_idx] + new.split('\n') + lines[end_idx:]
-        return '\n'.join(new_lines)
+        before = content[:start] if start is not None else content + '\n'
+        after = '\n' + content[end:] if end is not None else ''
+        return before + new + after
     
     # Fallback: append the new code as a comment showing the suggested fix
     return content + f"\n\n/* SUGGESTED FIX:\n{new}\n*/\n"
 
 
+def _line_offset(content: str, line_index: int) -> int | None:
+    """
+    Get the offset where a 0-indexed line starts.
+    
+    Returns:
+        Offset into content, or None if there is no such line
+    """
+    offset = 0
+    for _ in range(line_index):
+        offset = content.find('\n', offset) + 1
+        if offset == 0:
+            return None
+    return offset
+
+
 def create_pr_node(state: dict[str, Any]) -> dict[str, Any]:
     """
     LangGraph node for creating GitHub PRs.
@@ -202,6 +343,16 @@ def create_pr_node(state: dict[str, Any]) -> dict[str, Any]:
         - pr_created: bool - Whether PR was created
         - pr_error: str - Error message if failed
     """
+    return run_sync(create_pr_node_async(state))
+
+
+async def create_pr_node_async(state: dict[str, Any]) -> dict[str, Any]:
+    """
+    Async version of create_pr_node.
+    
+    Applies the code changes in worker threads, then runs the GitHub
+    calls in one event loop and MCP session.
+    """
     config = get_config()
     
     fix_proposal = state.get("fix_proposal")
@@ -209,7 +360,6 @@ def create_pr_node(state: dict[str, Any]) -> dict[str, Any]:
     
     if not user_approved or fix_proposal is None:
         return {
-            **state,
             "pr_created": False,
             "pr_url": None,
             "pr_error": "Fix not approved or no fix available"
@@ -217,7 +367,6 @@ def create_pr_node(state: dict[str, Any]) -> dict[str, Any]:
     
     if not fix_proposal.requires_pr:
         return {
-            **state,
             "pr_created": False,
             "pr_url": None,
             "pr_error": "This fix does not require a PR (config/data change)"
@@ -225,58 +374,81 @@ def create_pr_node(state: dict[str, Any]) -> dict[str, Any]:
     
     if not config.has_github_access:
         return {
-            **state,
             "pr_created": False,
             "pr_url": None,
             "pr_error": "GitHub access not configured"
         }
     
     try:
-        # Create GitHub integration via MCP
-        gh = GitHubIntegration(
+        # Get GitHub integration via MCP
+        gh = get_github_integration(
             token=config.github_token,
             repo_name=config.github_repo,
             target_branch=config.github_target_branch
         )
         
+        repo_root = Path(state.get("repo_root", "."))
+        pr_key = _pr_key(config, repo_root, fix_proposal)
+        with _created_prs_lock:
+            created = _created_prs.get(pr_key)
+        if created is not None:
+            return dict(created)
+        
+        # Only changes to files present locally can be applied
+        changes = [
+            change for change in fix_proposal.code_changes
+            if (repo_root / change.file_path).exists()
+        ]
+        
+        if not changes:
+            return {
+                "pr_created": False,
+                "pr_url": None,
+                "pr_error": "None of the changed files exist under the repository root"
+            }
+        
+        # Apply each code change locally first, so a change that fails
+        # to apply leaves no orphan branch on the remote
+        contents = await asyncio.gather(*[
+            asyncio.to_thread(apply_code_change, repo_root / change.file_path, change)
+            for change in changes
+        ])
+        
         # Create unique branch name
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        branch_name = f"fix/auto-{timestamp}"
-        gh.create_branch(branch_name)
+        branch_name = new_fix_branch_name()
         
-        # Apply each code change
-        repo_root = Path(state.get("repo_root", "."))
-        for change in fix_proposal.code_changes:
-            file_path = repo_root / change.file_path
+        # One MCP server session for the branch, push and PR
+        async with github_session():
+            await gh.create_branch_async(branch_name)
             
-            if file_path.exists():
-                new_content = apply_code_change(file_path, change)
-                
-                # Update on GitHub via MCP
-                gh.update_file(
-                    file_path=change.file_path,
-                    new_content=new_content,
-                    branch=branch_name,
-                    commit_message=f"fix: {change.explanation}"
-                )
-        
-        # Create PR via MCP
-        pr_url = gh.create_pull_request(
-            title=fix_proposal.title,
-            body=fix_proposal.get_pr_body(),
-            head_branch=branch_name
-        )
+            # Push all changed files in one commit via MCP
+            await gh.update_files_async(
+                files=[
+                    {"path": change.file_path, "content": content}
+                    for change, content in zip(changes, contents)
+                ],
+                branch=branch_name,
+                commit_message=f"fix: {fix_proposal.title}"
+            )
+            
+            # Create PR via MCP
+            pr_url = await gh.create_pull_request_async(
+                title=fix_proposal.title,
+                body=fix_proposal.get_pr_body(),
+                head_branch=branch_name
+            )
         
-        return {
-            **state,
+        result = {
             "pr_created": True,
             "pr_url": pr_url,
             "pr_error": None
         }
+        with _created_prs_lock:
+            _created_prs[pr_key] = result
+        return dict(result)
     
     except Exception as e:
         return {
-            **state,
             "pr_created": False,
             "pr_url": None,
             "pr_error": str(e)
@@ -6,11 +6,15 @@ The agent receives pre-filtered relevant logs, so this parser
 focuses on structuring the input rather than filtering.
 """
 
+import heapq
+import mmap
+import os
 import re
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
-from ..models.log_entry import LogEntry
+from ..models.log_entry import ERROR_LEVELS, LogEntry
 
 
 # Regex pattern for parsing log lines
@@ -26,6 +30,72 @@ LOG_PATTERN = re.compile(
 )
 
 
+# Same format as LOG_PATTERN, matched across a whole buffer at once.
+# Whitespace classes exclude newlines so a match never spans two lines.
+# The outer group captures the whole line (without leading whitespace)
+# so findall() can return plain tuples instead of Match objects.
+LOG_LINES_PATTERN = re.compile(
+    r'^[^\S\n]*('
+    r'(\d{2}:\d{2}:\d{2}\.\d{3})[^\S\n]+'     # Timestamp: HH:MM:SS.mmm
+    r'(\w+)[^\S\n]+'                             # Level: INFO, ERROR, etc.
+    r'(\S+)[^\S\n]+'                             # Source file
+    r'(\d{4})[^\S\n]+'                           # Line number (4 digits)
+    r'(\S+)[^\S\n]+'                             # Function name
+    r'(\d+)[^\S\n]*'                             # Thread ID
+    r'(.*))$',                                   # Message (rest of line)
+    re.MULTILINE
+)
+
+
+# LOG_LINES_PATTERN restricted to ERROR/CRITICAL lines (any case, as
+# levels are uppercased when parsed), so other lines are never built
+LOG_ERROR_LINES_PATTERN = re.compile(
+    LOG_LINES_PATTERN.pattern.replace(
+        r'(\w+)', '((?i:' + '|'.join(sorted(ERROR_LEVELS)) + '))', 1
+    ),
+    re.MULTILINE
+)
+
+
+# Bytes version of LOG_LINES_PATTERN for scanning memory-mapped files
+LOG_LINES_PATTERN_BYTES = re.compile(LOG_LINES_PATTERN.pattern.encode('ascii'), re.MULTILINE)
+
+
+# Bytes the bytes pattern would read differently from decoded text: a
+# lone \r ends a line in text mode (universal newlines), \x1c-\x1f are
+# whitespace to str patterns, and str \s, \d and \w also match non-ASCII
+# characters. Files containing any of them are parsed as text instead.
+_NON_PLAIN_BYTES = re.compile(rb'[\r\x1c-\x1f\x80-\xff]')
+
+
+# Raw level text -> shared uppercase level name, so every entry of a
+# level references one interned string
+_LEVEL_NAMES: dict[str, str] = {}
+
+
+def _level_name(level: str) -> str:
+    """Get the canonical (uppercase, interned) name for a level."""
+    name = _LEVEL_NAMES.get(level)
+    if name is None:
+        name = _LEVEL_NAMES[level] = sys.intern(level.upper())
+    return name
+
+
+def _entry_from_match(match: re.Match) -> LogEntry:
+    """Build a LogEntry from a LOG_PATTERN match of a stripped line (kept as raw_line)."""
+    timestamp, level, source_file, line_number, function_name, thread_id, message = match.groups()
+    return LogEntry(
+        timestamp=timestamp,
+        level=_level_name(level),
+        source_file=sys.intern(source_file),
+        line_number=int(line_number),
+        function_name=sys.intern(function_name),
+        thread_id=thread_id,
+        message=message.strip(),
+        raw_line=match.string
+    )
+
+
 def parse_log_line(line: str) -> LogEntry | None:
     """
     Parse a single log line into a LogEntry object.
@@ -37,7 +107,9 @@ def parse_log_line(line: str) -> LogEntry | None:
         LogEntry if parsing succeeded, None otherwise
     """
     line = line.strip()
-    if not line:
+    # Every log line starts with the HH of its timestamp; reject banners,
+    # stack traces and blank lines before running the regex
+    if not line[:2].isdigit():
         return None
     
     match = LOG_PATTERN.match(line)
@@ -45,16 +117,7 @@ def parse_log_line(line: str) -> LogEntry | None:
         return None
     
     try:
-        return LogEntry(
-            timestamp=match.group(1),
-            level=match.group(2).upper(),
-            source_file=match.group(3),
-            line_number=int(match.group(4)),
-            function_name=match.group(5),
-            thread_id=match.group(6),
-            message=match.group(7).strip(),
-            raw_line=line
-        )
+        return _entry_from_match(match)
     except (ValueError, IndexError):
         return None
 
@@ -63,18 +126,51 @@ def parse_log_content(content: str) -> list[LogEntry]:
     """
     Parse log content (string) into a list of LogEntry objects.
     
+    Scans the whole buffer with one compiled pattern instead of
+    splitting it into lines first; lines that don't match are skipped.
+    
     Args:
         content: Raw log file content as string
     
     Returns:
         List of parsed LogEntry objects
     """
-    entries = []
-    for line in content.split('\n'):
-        entry = parse_log_line(line)
-        if entry:
-            entries.append(entry)
-    return entries
+    return _entries_from_rows(LOG_LINES_PATTERN.findall(content))
+
+
+def parse_errors_only(content: str) -> list[LogEntry]:
+    """
+    Parse only the ERROR and CRITICAL entries from log content.
+    
+    Same result as extract_errors(parse_log_content(content)), but the
+    filter is part of the pattern, so other lines are never turned
+    into LogEntry objects.
+    
+    Args:
+        content: Raw log file content as string
+    
+    Returns:
+        List of ERROR and CRITICAL level entries
+    """
+    return _entries_from_rows(LOG_ERROR_LINES_PATTERN.findall(content))
+
+
+def _entries_from_rows(rows: list[tuple[str, ...]]) -> list[LogEntry]:
+    """Build LogEntry objects from LOG_LINES_PATTERN findall() rows."""
+    return [
+        LogEntry(
+            timestamp=timestamp,
+            level=_level_name(level),
+            source_file=sys.intern(source_file),
+            line_number=int(line_number),
+            function_name=sys.intern(function_name),
+            thread_id=thread_id,
+            message=message.strip(),
+            raw_line=raw_line.rstrip()
+        )
+        for raw_line, timestamp, level, source_file, line_number, function_name, thread_id, message
+        in rows
+    ]
 
 
 def parse_log_file(file_path: str | Path) -> list[LogEntry]:
@@ -91,8 +187,85 @@ def parse_log_file(file_path: str | Path) -> list[LogEntry]:
     if not path.exists():
         raise FileNotFoundError(f"Log file not found: {file_path}")
     
-    content = path.read_text(encoding='utf-8', errors='replace')
-    return parse_log_content(content)
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        # Scan a plain (ASCII, \n-terminated) file directly in the mapping;
+        # only matched fields are decoded
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if not _NON_PLAIN_BYTES.search(buffer):
+                return _parse_log_buffer(buffer)
+    
+    return parse_log_content(path.read_text(encoding='utf-8', errors='replace'))
+
+
+def iter_log_file(file_path: str | Path) -> Iterator[LogEntry]:
+    """
+    Parse a log file lazily, one LogEntry at a time.
+    
+    The file is memory-mapped and scanned in place (or read line by line
+    if it isn't plain ASCII), so only the entries the caller keeps stay
+    in memory; use this instead of parse_log_file to stream through logs
+    too large to hold as a list.
+    
+    Args:
+        file_path: Path to the log file
+    
+    Yields:
+        Parsed LogEntry objects, in file order
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Log file not found: {file_path}")
+    
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if not _NON_PLAIN_BYTES.search(buffer):
+                for match in LOG_LINES_PATTERN_BYTES.finditer(buffer):
+                    yield _entry_from_bytes_match(match)
+                return
+    
+    # Decode like parse_log_file does, still one line at a time
+    with open(path, encoding='utf-8', errors='replace') as text:
+        for line in text:
+            entry = parse_log_line(line)
+            if entry:
+                yield entry
+
+
+def _parse_log_buffer(buffer: bytes | mmap.mmap) -> list[LogEntry]:
+    """Parse UTF-8 log bytes, decoding each matched field."""
+    return [
+        LogEntry(
+            timestamp=timestamp.decode('ascii'),
+            level=_level_name(level.decode('ascii')),
+            source_file=sys.intern(source_file.decode('utf-8', errors='replace')),
+            line_number=int(line_number),
+            function_name=sys.intern(function_name.decode('utf-8', errors='replace')),
+            thread_id=thread_id.decode('ascii'),
+            message=message.decode('utf-8', errors='replace').strip(),
+            raw_line=raw_line.decode('utf-8', errors='replace').rstrip()
+        )
+        for raw_line, timestamp, level, source_file, line_number, function_name, thread_id, message
+        in LOG_LINES_PATTERN_BYTES.findall(buffer)
+    ]
+
+
+def _entry_from_bytes_match(match: re.Match) -> LogEntry:
+    """Build a LogEntry from a LOG_LINES_PATTERN_BYTES match."""
+    raw_line, timestamp, level, source_file, line_number, function_name, thread_id, message = match.groups()
+    return LogEntry(
+        timestamp=timestamp.decode('ascii'),
+        level=_level_name(level.decode('ascii')),
+        source_file=sys.intern(source_file.decode('utf-8', errors='replace')),
+        line_number=int(line_number),
+        function_name=sys.intern(function_name.decode('utf-8', errors='replace')),
+        thread_id=thread_id.decode('ascii'),
+        message=message.decode('utf-8', errors='replace').strip(),
+        raw_line=raw_line.decode('utf-8', errors='replace').rstrip()
+    )
 
 
 def extract_errors(entries: list[LogEntry]) -> list[LogEntry]:
@@ -105,7 +278,7 @@ def extract_errors(entries: list[LogEntry]) -> list[LogEntry]:
     Returns:
         List of ERROR and CRITICAL level entries
     """
-    return [entry for entry in entries if entry.is_error()]
+    return [entry for entry in entries if entry.level in ERROR_LEVELS]
 
 
 def group_related_entries(
@@ -146,6 +319,50 @@ def group_related_entries(
     return same_thread[start:end]
 
 
+class ContextIndex:
+    """
+    Per-thread index over log entries for repeated context lookups.
+    
+    Built once per log; window() then returns the same result as
+    group_related_entries without rescanning every entry.
+    """
+    
+    def __init__(self, entries: list[LogEntry]):
+        """
+        Build the index.
+        
+        Args:
+            entries: All log entries
+        """
+        self._threads: dict[str, list[LogEntry]] = {}
+        self._positions: dict[tuple[str, str], int] = {}
+        
+        for entry in entries:
+            same_thread = self._threads.setdefault(entry.thread_id, [])
+            # First occurrence wins, as in group_related_entries
+            self._positions.setdefault((entry.thread_id, entry.raw_line), len(same_thread))
+            same_thread.append(entry)
+    
+    def window(self, target_entry: LogEntry, context_lines: int = 5) -> list[LogEntry]:
+        """
+        Get related log entries around a target error entry.
+        
+        Args:
+            target_entry: The error entry to find context for
+            context_lines: Number of entries before/after to include
+        
+        Returns:
+            List of related entries including the target
+        """
+        target_idx = self._positions.get((target_entry.thread_id, target_entry.raw_line))
+        if target_idx is None:
+            return [target_entry]
+        
+        same_thread = self._threads[target_entry.thread_id]
+        start = max(0, target_idx - context_lines)
+        return same_thread[start:target_idx + context_lines + 1]
+
+
 def group_errors_by_context(
     entries: list[LogEntry],
     errors: list[LogEntry]
@@ -169,16 +386,12 @@ def group_errors_by_context(
         return []
     
     # Group by source file + function combination
-    groups: dict[str, list[LogEntry]] = {}
+    groups: dict[tuple[str, str], list[LogEntry]] = {}
     
     for error in errors:
-        # Create a key based on source file and error pattern
-        # This groups errors that likely have the same root cause
-        key = f"{error.source_file}:{error.function_name}"
-        
-        if key not in groups:
-            groups[key] = []
-        groups[key].append(error)
+        # Key on source file and function: errors that likely have
+        # the same root cause
+        groups.setdefault((error.source_file, error.function_name), []).append(error)
     
     return list(groups.values())
 
@@ -210,6 +423,46 @@ def get_full_context_for_group(
     return context_entries
 
 
+def collect_error_groups(
+    entries: list[LogEntry]
+) -> tuple[list[LogEntry], list[list[LogEntry]], list[list[LogEntry]]]:
+    """
+    Extract, group and gather context for errors in a single pass.
+    
+    Equivalent to extract_errors, group_errors_by_context and
+    get_full_context_for_group for every group, without walking
+    the entries once per step and once per group.
+    
+    Args:
+        entries: All log entries
+    
+    Returns:
+        Tuple of (errors, error groups, full context for each group)
+    """
+    errors = []
+    groups: dict[tuple[str, str], list[LogEntry]] = {}
+    by_thread: dict[str, list[tuple[int, LogEntry]]] = {}
+    
+    for position, entry in enumerate(entries):
+        by_thread.setdefault(entry.thread_id, []).append((position, entry))
+        if entry.level in ERROR_LEVELS:
+            errors.append(entry)
+            groups.setdefault((entry.source_file, entry.function_name), []).append(entry)
+    
+    error_groups = list(groups.values())
+    
+    # Merge each group's per-thread runs back into log order
+    contexts = [
+        [entry for _, entry in heapq.merge(*(
+            by_thread[thread_id]
+            for thread_id in dict.fromkeys(error.thread_id for error in group)
+        ))]
+        for group in error_groups
+    ]
+    
+    return errors, error_groups, contexts
+
+
 def parse_logs_node(state: dict[str, Any]) -> dict[str, Any]:
     """
     LangGraph node for parsing logs.
@@ -221,6 +474,7 @@ def parse_logs_node(state: dict[str, Any]) -> dict[str, Any]:
     
     Updates state with:
         - log_entries: List[LogEntry] - All parsed entries
+        - context_index: ContextIndex - Per-thread index for context lookups
         - error_groups: List[List[LogEntry]] - Grouped related errors
         - current_group_index: int - Index of current error group
         - total_groups: int - Total number of error groups
@@ -233,15 +487,13 @@ def parse_logs_node(state: dict[str, Any]) -> dict[str, Any]:
     else:
         raise ValueError("State must contain either 'log_content' or 'log_file_path'")
     
-    # Extract errors
-    errors = extract_errors(entries)
-    
-    # Group related errors
-    error_groups = group_errors_by_context(entries, errors)
+    # Extract and group errors in one pass
+    errors, error_groups, _ = collect_error_groups(entries)
     
+    # Only the new keys are returned; LangGraph merges them into the state
     return {
-        **state,
         "log_entries": entries,
+        "context_index": ContextIndex(entries),
         "error_entries": errors,
         "error_groups": error_groups,
         "current_group_index": 0,
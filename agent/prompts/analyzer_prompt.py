@@ -66,6 +66,47 @@ Be precise and technical. Reference specific files, functions, and line numbers
 """
 
 
+# Static instructions, placed before the per-error sections so every
+# analysis request shares the same prompt prefix (provider prompt caching)
+_ANALYZER_INSTRUCTIONS = """Analyze the error from a C++ payment switch system shown below.
+
+## Required Analysis
+
+Please provide your analysis in the following JSON format:
+```json
+{
+    "error_type": "one of: code_bug, string_handling, null_pointer, missing_config, missing_data, database_error, cache_error, external_service, unknown",
+    "is_code_issue": true or false,
+    "root_cause": "Detailed explanation of what is causing this error",
+    "suggested_approach": "How to fix this error",
+    "affected_function": "The function name that needs to be modified (if code issue)",
+    "confidence": 0.0 to 1.0
+}
+```
+"""
+
+_RESPOND_JSON_ONLY = """
+Respond ONLY with the JSON, no additional text.
+"""
+
+# Section wrappers; the (possibly large) section bodies are joined
+# between them rather than copied through an f-string first
+_ERROR_LOGS_OPEN = """
+## Error Log Entries
+```
+"""
+_SOURCE_CODE_OPEN = """
+## Relevant Source Code
+```cpp
+"""
+_FENCE_CLOSE = """
+```
+"""
+_ADDITIONAL_CONTEXT_OPEN = """
+## Additional Context
+"""
+
+
 def get_analyzer_prompt(
     error_logs: str,
     source_code: str | None = None,
@@ -74,6 +115,9 @@ def get_analyzer_prompt(
     """
     Generate the analysis prompt for the LLM.
     
+    The static instructions come first and the error-specific
+    sections last.
+    
     Args:
         error_logs: The error log entries to analyze
         source_code: Optional relevant source code content
@@ -82,44 +126,17 @@ def get_analyzer_prompt(
     Returns:
         Formatted prompt string for the LLM
     """
-    prompt = f"""Analyze the following error from a C++ payment switch system:
-
-## Error Log Entries
-```
-{error_logs}
-```
-"""
-
+    parts = [
+        _ANALYZER_INSTRUCTIONS,
+        _ERROR_LOGS_OPEN, error_logs, _FENCE_CLOSE,
+    ]
+    
     if source_code:
-        prompt += f"""
-## Relevant Source Code
-```cpp
-{source_code}
-```
-"""
-
+        parts += (_SOURCE_CODE_OPEN, source_code, _FENCE_CLOSE)
+    
     if additional_context:
-        prompt += f"""
-## Additional Context
-{additional_context}
-"""
-
-    prompt += """
-## Required Analysis
-
-Please provide your analysis in the following JSON format:
-```json
-{
-    "error_type": "one of: code_bug, string_handling, null_pointer, missing_config, missing_data, database_error, cache_error, external_service, unknown",
-    "is_code_issue": true or false,
-    "root_cause": "Detailed explanation of what is causing this error",
-    "suggested_approach": "How to fix this error",
-    "affected_function": "The function name that needs to be modified (if code issue)",
-    "confidence": 0.0 to 1.0
-}
-```
-
-Respond ONLY with the JSON, no additional text.
-"""
+        parts += (_ADDITIONAL_CONTEXT_OPEN, additional_context, "\n")
+    
+    parts.append(_RESPOND_JSON_ONLY)
     
-    return prompt
+    return "".join(parts)
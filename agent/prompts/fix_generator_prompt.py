@@ -52,41 +52,31 @@ def get_fix_generator_prompt(
         return _get_config_data_fix_prompt(error_analysis, error_type)
 
 
-def _get_code_fix_prompt(error_analysis: dict, source_code: str, file_path: str) -> str:
-    """Generate prompt for code fixes."""
-    return f"""Generate a code fix for the following error:
-
-## Error Analysis
-- Root Cause: {error_analysis.get('root_cause', 'Unknown')}
-- Suggested Approach: {error_analysis.get('suggested_approach', 'Unknown')}
-- Affected Function: {error_analysis.get('affected_function', 'Unknown')}
-
-## Source File: {file_path}
-```cpp
-{source_code}
-```
+# Static instructions, placed before the per-error sections so every
+# fix request of a kind shares the same prompt prefix (provider prompt caching)
+_CODE_FIX_INSTRUCTIONS = """Generate a code fix for the error described below.
 
 ## Required Output
 
 Generate the fix in the following JSON format:
 ```json
-{{
+{
     "title": "Brief title for the fix (max 60 chars)",
     "description": "Detailed description of what the fix does and why",
     "risk_level": "low, medium, or high",
     "confidence": 0.0 to 1.0,
     "code_changes": [
-        {{
-            "file_path": "{file_path}",
+        {
+            "file_path": "<the Source File path given below>",
             "line_start": <starting line number>,
             "line_end": <ending line number>,
             "original_code": "The exact code to be replaced (copy from source)",
             "new_code": "The replacement code with the fix",
             "explanation": "Why this change fixes the issue"
-        }}
+        }
     ],
     "manual_instructions": "Any manual steps needed (or null if none)"
-}}
+}
 ```
 
 Guidelines:
@@ -94,44 +84,89 @@ Guidelines:
 2. Add proper error handling and validation
 3. Match the existing code style
 4. Include comments explaining the fix
-
-Respond ONLY with the JSON, no additional text.
 """
 
-
-def _get_config_data_fix_prompt(error_analysis: dict, error_type: str) -> str:
-    """Generate prompt for configuration/data fixes."""
-    return f"""Generate a configuration or data fix for the following error:
-
-## Error Analysis
-- Error Type: {error_type}
-- Root Cause: {error_analysis.get('root_cause', 'Unknown')}
-- Suggested Approach: {error_analysis.get('suggested_approach', 'Unknown')}
+_CONFIG_DATA_FIX_INSTRUCTIONS = """Generate a configuration or data fix for the error described below.
 
 ## Required Output
 
 Generate the fix in the following JSON format:
 ```json
-{{
+{
     "title": "Brief title for the fix (max 60 chars)",
     "description": "Detailed description of what needs to be done",
     "risk_level": "low, medium, or high",
     "confidence": 0.0 to 1.0,
     "fix_type": "config_change, data_insert, or data_update",
-    "config_changes": {{
+    "config_changes": {
         "key": "value to add or modify"
-    }},
+    },
     "data_operations": [
         "SQL or Redis command to execute"
     ],
     "manual_instructions": "Steps to apply this fix manually"
-}}
+}
 ```
 
 Guidelines:
 1. Be specific about the exact configuration keys or table/cache names
 2. Provide complete SQL/Redis commands that can be executed directly
 3. Include verification steps in manual_instructions
+"""
 
+_RESPOND_JSON_ONLY = """
 Respond ONLY with the JSON, no additional text.
 """
+
+
+# Section wrappers for the code fix prompt; the (possibly large)
+# source code is joined between them rather than copied through an
+# f-string first
+_SOURCE_FILE_OPEN = """
+## Source File: """
+_SOURCE_CODE_OPEN = """
+```cpp
+"""
+_FENCE_CLOSE = """
+```
+"""
+
+
+def _format_error_analysis(error_analysis: dict) -> str:
+    """Format the analyzer fields used by the code fix prompt."""
+    return f"""
+## Error Analysis
+- Root Cause: {error_analysis.get('root_cause', 'Unknown')}
+- Suggested Approach: {error_analysis.get('suggested_approach', 'Unknown')}
+- Affected Function: {error_analysis.get('affected_function', 'Unknown')}
+"""
+
+
+def _get_code_fix_prompt(error_analysis: dict, source_code: str, file_path: str) -> str:
+    """Generate prompt for code fixes."""
+    return "".join((
+        _CODE_FIX_INSTRUCTIONS,
+        _format_error_analysis(error_analysis),
+        _SOURCE_FILE_OPEN, file_path,
+        _SOURCE_CODE_OPEN, source_code, _FENCE_CLOSE,
+        _RESPOND_JSON_ONLY,
+    ))
+
+
+def _format_config_error_analysis(error_analysis: dict, error_type: str) -> str:
+    """Format the analyzer fields used by the config/data fix prompt."""
+    return f"""
+## Error Analysis
+- Error Type: {error_type}
+- Root Cause: {error_analysis.get('root_cause', 'Unknown')}
+- Suggested Approach: {error_analysis.get('suggested_approach', 'Unknown')}
+"""
+
+
+def _get_config_data_fix_prompt(error_analysis: dict, error_type: str) -> str:
+    """Generate prompt for configuration/data fixes."""
+    return "".join((
+        _CONFIG_DATA_FIX_INSTRUCTIONS,
+        _format_config_error_analysis(error_analysis, error_type),
+        _RESPOND_JSON_ONLY,
+    ))
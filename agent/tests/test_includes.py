@@ -61,6 +61,18 @@ void main() {}
         
         assert includes.count("header.h") == 1
     
+    def test_local_includes_first(self):
+        """Test that "" includes are listed before <> includes."""
+        source = '''
+#include <vector>
+#include "first.h"
+#include <customlib.h>
+#include "second.h"
+'''
+        includes = _parse_includes(source)
+        
+        assert includes == ["first.h", "second.h", "vector", "customlib.h"]
+    
     def test_empty_source(self):
         """Test parsing empty source returns empty list."""
         includes = _parse_includes("")
@@ -89,6 +101,17 @@ void main() {
         assert "transaction.h" in includes
         assert "utils.h" in includes
         assert "logger.h" in includes
+    
+    def test_only_directives_are_parsed(self):
+        """Test that indented/spaced directives count and commented-out mentions don't."""
+        source = '''
+  #  include "spaced.h"
+// #include "commented.h"
+const char* s = "#include <string_literal.h>";
+'''
+        includes = _parse_includes(source)
+        
+        assert includes == ["spaced.h"]
 
 
 class TestGetSourceWithIncludes:
@@ -0,0 +1,34 @@
+"""
+Unit tests for LLM response JSON parsing.
+"""
+
+from types import MappingProxyType
+
+from agent.utils.json_utils import parse_llm_json
+
+
+DEFAULT = MappingProxyType({"title": "fallback", "code_changes": ()})
+
+
+class TestParseLlmJson:
+    """Tests for parse_llm_json function."""
+    
+    def test_plain_json(self):
+        """Test parsing a bare JSON object."""
+        assert parse_llm_json('{"a": 1}', DEFAULT) == {"a": 1}
+    
+    def test_fenced_json(self):
+        """Test parsing JSON wrapped in a markdown code fence."""
+        response = '```json\n{"a": 1}\n```'
+        assert parse_llm_json(response, DEFAULT) == {"a": 1}
+    
+    def test_nested_json_with_prose(self):
+        """Test extracting nested JSON surrounded by text."""
+        response = 'Here is the fix:\n{"a": {"b": [1, 2]}}\nHope this helps.'
+        assert parse_llm_json(response, DEFAULT) == {"a": {"b": [1, 2]}}
+    
+    def test_unparseable_returns_default(self):
+        """Test that unparseable responses return the shared default."""
+        result = parse_llm_json("no json here", DEFAULT)
+        
+        assert result is DEFAULT
@@ -0,0 +1,87 @@
+"""
+Unit tests for the LLM response cache.
+"""
+
+import asyncio
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from agent.utils import llm_cache
+from agent.utils.llm_cache import LLMCache, invoke_cached, ainvoke_cached
+
+
+DEFAULT = MappingProxyType({"title": "fallback"})
+
+
+class FakeLLM:
+    """Streams scripted replies and counts calls."""
+    
+    model_name = "fake"
+    temperature = 0.0
+    
+    def __init__(self, *replies: str):
+        self.replies = list(replies)
+        self.calls = 0
+    
+    def _next(self) -> list:
+        self.calls += 1
+        return [SimpleNamespace(content=self.replies.pop(0))]
+    
+    def stream(self, messages):
+        return iter(self._next())
+    
+    async def astream(self, messages):
+        for chunk in self._next():
+            yield chunk
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(llm_cache, "_llm_cache", LLMCache())
+
+
+class TestInvokeCached:
+    """Tests for invoke_cached and ainvoke_cached."""
+    
+    def test_parsed_reply_is_cached(self):
+        """Test that a valid JSON reply is reused for the same request."""
+        llm = FakeLLM('{"title": "fix"}')
+        messages = [HumanMessage(content="analyze")]
+        
+        assert invoke_cached(llm, messages, DEFAULT) == {"title": "fix"}
+        assert invoke_cached(llm, messages, DEFAULT) == {"title": "fix"}
+        assert llm.calls == 1
+    
+    def test_unparseable_reply_is_not_cached(self):
+        """Test that a truncated reply is retried instead of replayed."""
+        llm = FakeLLM('{"title": "fi', '{"title": "fix"}')
+        messages = [HumanMessage(content="analyze")]
+        
+        assert invoke_cached(llm, messages, DEFAULT) is DEFAULT
+        assert invoke_cached(llm, messages, DEFAULT) == {"title": "fix"}
+        assert llm.calls == 2
+    
+    def test_async_unparseable_reply_is_not_cached(self):
+        """Test that ainvoke_cached also skips unparseable replies."""
+        llm = FakeLLM("Sorry, I can't help", '{"title": "fix"}')
+        messages = [HumanMessage(content="analyze")]
+        
+        assert asyncio.run(ainvoke_cached(llm, messages, DEFAULT)) is DEFAULT
+        assert asyncio.run(ainvoke_cached(llm, messages, DEFAULT)) == {"title": "fix"}
+        assert llm.calls == 2
+
+
+class TestMakeKey:
+    """Tests for LLMCache.make_key."""
+    
+    def test_key_does_not_depend_on_orjson(self, monkeypatch):
+        """Test that the json fallback hashes the same bytes as orjson."""
+        pytest.importorskip("orjson")
+        messages = [HumanMessage(content="analyse « payment » failure")]
+        
+        with_orjson = LLMCache.make_key("fake", messages, 0.2)
+        monkeypatch.setattr(llm_cache, "orjson", None)
+        
+        assert LLMCache.make_key("fake", messages, 0.2) == with_orjson
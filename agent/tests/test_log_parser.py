@@ -2,14 +2,25 @@
 Unit tests for the log parser module.
 """
 
+import re
+
 import pytest
 from pathlib import Path
+from unittest import mock
 
 from agent.nodes.log_parser import (
     parse_log_line,
     parse_log_content,
     extract_errors,
-    group_related_entries
+    group_related_entries,
+    group_errors_by_context,
+    get_full_context_for_group,
+    collect_error_groups,
+    ContextIndex,
+    parse_log_file,
+    iter_log_file,
+    parse_logs_node,
+    parse_errors_only
 )
 from agent.models.log_entry import LogEntry
 
@@ -64,6 +75,15 @@ class TestParseLogLine:
         """Test parsing a malformed line returns None."""
         assert parse_log_line("This is not a valid log line") is None
         assert parse_log_line("17:13:30 INFO incomplete") is None
+        assert parse_log_line("    at main (translator.cpp:78)") is None
+    
+    def test_parse_space_separated_line(self):
+        """Test fields separated by spaces instead of tabs still parse."""
+        entry = parse_log_line(SAMPLE_ERROR_LINE.replace("\t", " "))
+        
+        assert entry is not None
+        assert entry.level == "ERROR"
+        assert entry.line_number == 1654
 
 
 class TestParseLogContent:
@@ -90,6 +110,111 @@ class TestParseLogContent:
         """Test parsing empty content."""
         entries = parse_log_content("")
         assert len(entries) == 0
+    
+    def test_matches_expected_entries(self):
+        """Test whole-buffer parsing against known entries, padding and noise included."""
+        content = (
+            f"  {SAMPLE_INFO_LINE}  \r\n"
+            "Banner line that is not a log entry\n"
+            f"{SAMPLE_ERROR_LINE}\r\n"
+            "17:13:30 INFO incomplete\n"
+            f"\t{SAMPLE_CRITICAL_LINE}"
+        )
+        # raw_line is the line with surrounding whitespace stripped
+        expected = [
+            LogEntry(
+                timestamp="17:13:30.548",
+                level="INFO",
+                source_file="translator.cpp",
+                line_number=78,
+                function_name="ProcessIncomin",
+                thread_id="58197610545000",
+                message="STEP1: Message fields parsed successfully",
+                raw_line=SAMPLE_INFO_LINE
+            ),
+            LogEntry(
+                timestamp="17:13:30.550",
+                level="ERROR",
+                source_file="translator.cpp",
+                line_number=1654,
+                function_name="CheckCondition",
+                thread_id="58197610545000",
+                message="Condition unmatched",
+                raw_line=SAMPLE_ERROR_LINE
+            ),
+            LogEntry(
+                timestamp="17:13:34.662",
+                level="CRITICAL",
+                source_file="translatormasterca",
+                line_number=204,
+                function_name="mapIncomingFie",
+                thread_id="58197610545001",
+                message=(
+                    "failed to parse additionalPOSInformation basic_string::substr: "
+                    "__pos (which is 3) > this->size() (which is 0)"
+                ),
+                raw_line=SAMPLE_CRITICAL_LINE
+            ),
+        ]
+        
+        assert parse_log_content(content) == expected
+        assert [parse_log_line(line) for line in content.split('\n')[::2]] == expected
+    
+    def test_repeated_fields_are_shared(self):
+        """Test that entries share one string per level, file and function."""
+        first, second = parse_log_content(f"{SAMPLE_ERROR_LINE}\n{SAMPLE_ERROR_LINE}")
+        
+        assert first.level is second.level
+        assert first.source_file is second.source_file
+        assert first.function_name is second.function_name
+    
+    def test_iter_log_file(self, tmp_path):
+        """Test that streaming a file yields the same entries as parsing it."""
+        log_file = tmp_path / "app.log"
+        log_file.write_text(
+            "\n".join([SAMPLE_INFO_LINE, "=== banner ===", SAMPLE_ERROR_LINE]) + "\n"
+        )
+        
+        assert list(iter_log_file(log_file)) == parse_log_file(log_file)
+        
+        empty_file = tmp_path / "empty.log"
+        empty_file.touch()
+        assert list(iter_log_file(empty_file)) == []
+    
+    @pytest.mark.parametrize("content", [
+        f"{SAMPLE_INFO_LINE}\r\n{SAMPLE_ERROR_LINE}\r\n",
+        f"{SAMPLE_INFO_LINE}\r{SAMPLE_ERROR_LINE}\r{SAMPLE_CRITICAL_LINE}",
+        f"{SAMPLE_ERROR_LINE.replace(' ', chr(0xa0))}\n{SAMPLE_INFO_LINE} café\n",
+        f"{SAMPLE_ERROR_LINE.replace(' ', chr(0x1f))}\n{SAMPLE_CRITICAL_LINE}\n",
+    ])
+    def test_file_parsing_matches_text_parsing(self, tmp_path, content):
+        """Test that file parsing handles newlines and whitespace like decoded text."""
+        log_file = tmp_path / "app.log"
+        log_file.write_bytes(content.encode("utf-8"))
+        expected = parse_log_content(log_file.read_text(encoding="utf-8"))
+        
+        assert expected
+        assert parse_log_file(log_file) == expected
+        assert list(iter_log_file(log_file)) == expected
+
+
+class TestParseLogsNode:
+    """Tests for parse_logs_node."""
+    
+    def test_hot_path_skips_per_line_parsing(self, tmp_path):
+        """Test that the node neither parses line by line nor compiles patterns."""
+        content = f"{SAMPLE_INFO_LINE}\n{SAMPLE_ERROR_LINE}\n{SAMPLE_CRITICAL_LINE}\n"
+        log_file = tmp_path / "app.log"
+        log_file.write_text(content)
+        
+        with mock.patch("agent.nodes.log_parser.parse_log_line", side_effect=AssertionError), \
+                mock.patch.object(re, "compile", side_effect=AssertionError):
+            from_content = parse_logs_node({"log_content": content})
+            from_file = parse_logs_node({"log_file_path": str(log_file)})
+        
+        assert from_content["log_entries"] == from_file["log_entries"]
+        assert len(from_content["log_entries"]) == 3
+        assert from_content["total_groups"] == 2
 
 
 class TestExtractErrors:
@@ -110,6 +235,19 @@ class TestExtractErrors:
         errors = extract_errors(entries)
         
         assert len(errors) == 0
+    
+    def test_parse_errors_only_matches_extract(self):
+        """Test that the fused parse+filter matches parsing then filtering."""
+        content = "\n".join([
+            SAMPLE_INFO_LINE,
+            SAMPLE_ERROR_LINE.replace("ERROR", "Error"),
+            SAMPLE_ERROR_LINE.replace("ERROR", "ERRORS"),
+            SAMPLE_CRITICAL_LINE,
+        ])
+        errors = parse_errors_only(content)
+        
+        assert errors == extract_errors(parse_log_content(content))
+        assert [e.level for e in errors] == ["ERROR", "CRITICAL"]
 
 
 class TestGroupRelatedEntries:
@@ -139,6 +277,30 @@ class TestGroupRelatedEntries:
         # Should only include the CRITICAL entry (different thread)
         assert len(related) == 1
         assert related[0].level == "CRITICAL"
+    
+    def test_context_index_matches(self):
+        """Test that ContextIndex.window matches group_related_entries."""
+        content = "\n".join([SAMPLE_INFO_LINE, SAMPLE_ERROR_LINE, SAMPLE_CRITICAL_LINE] * 4)
+        entries = parse_log_content(content)
+        index = ContextIndex(entries)
+        
+        for target in entries:
+            assert index.window(target, context_lines=2) == group_related_entries(entries, target, context_lines=2)
+
+
+class TestCollectErrorGroups:
+    """Tests for collect_error_groups function."""
+    
+    def test_matches_separate_steps(self):
+        """Test that the fused pass matches the separate helpers."""
+        content = "\n".join([SAMPLE_INFO_LINE, SAMPLE_ERROR_LINE, SAMPLE_CRITICAL_LINE] * 3)
+        entries = parse_log_content(content)
+        
+        errors, groups, contexts = collect_error_groups(entries)
+        
+        assert errors == extract_errors(entries)
+        assert groups == group_errors_by_context(entries, errors)
+        assert contexts == [get_full_context_for_group(entries, group) for group in groups]
 
 
 class TestLogEntryMethods:
@@ -157,6 +319,13 @@ class TestLogEntryMethods:
         assert "[ERROR]" in context
         assert "translator.cpp:1654" in context
         assert "CheckCondition()" in context
+    
+    def test_no_instance_dict(self):
+        """Test that entries are slotted (no per-entry __dict__)."""
+        entry = parse_log_line(SAMPLE_ERROR_LINE)
+        
+        assert not hasattr(entry, "__dict__")
+        assert entry.is_error()
 
 
 if __name__ == "__main__":
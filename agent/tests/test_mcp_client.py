@@ -0,0 +1,122 @@
+"""
+Unit tests for the MCP client retry policy and file cache.
+"""
+
+import asyncio
+from collections import OrderedDict
+
+import pytest
+
+from agent.utils import mcp_client
+from agent.utils.mcp_client import _http_status, _is_transient
+
+
+@pytest.fixture
+def tool_calls(monkeypatch):
+    """Replace tool calls with scripted results; returns the call log."""
+    calls: list[str] = []
+    monkeypatch.setattr(mcp_client, "RETRY_BASE_DELAY", 0)
+    
+    def script(results: dict):
+        async def call(tool_name, arguments):
+            calls.append(tool_name)
+            outcome = results[tool_name].pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        monkeypatch.setattr(mcp_client, "_call_tool_async", call)
+        return calls
+    
+    return script
+
+
+class TestTransientErrors:
+    """Tests for _http_status and _is_transient."""
+    
+    def test_server_error_kinds(self):
+        """Test that GitHub MCP error prefixes map to their status."""
+        assert _http_status(Exception("Not Found: Resource not found")) == 404
+        assert _http_status(Exception("MCP error -32603: Validation Error: exists")) == 422
+        assert _is_transient(Exception("Rate Limit Exceeded: try later"))
+    
+    def test_numbers_in_message_are_not_statuses(self):
+        """Test that SHAs, paths and line numbers don't look like 5xx errors."""
+        assert not _is_transient(Exception("Not Found: src/handler503.cpp"))
+        assert not _is_transient(Exception("Conflict: 5040ab1 is not a fast-forward"))
+        assert not _is_transient(Exception("failed at line 502"))
+    
+    def test_explicit_status_and_timeouts(self):
+        """Test that 5xx statuses and timeouts are retried."""
+        assert _is_transient(Exception("GitHub API Error: Server Error (status 503)"))
+        assert _is_transient(TimeoutError("create_branch timed out after 30s"))
+
+
+class TestWriteRetries:
+    """Tests for the single, checked retry of write tools."""
+    
+    def test_applied_write_is_not_repeated(self, tool_calls):
+        """Test that a timed-out branch creation that took effect isn't resent."""
+        calls = tool_calls({
+            "create_branch": [TimeoutError("timed out")],
+            "list_commits": ['[{"sha": "abc", "commit": {"message": "init"}}]'],
+        })
+        
+        assert asyncio.run(mcp_client.create_branch_async("o", "r", "fix/x")) is True
+        assert calls == ["create_branch", "list_commits"]
+    
+    def test_unapplied_write_is_retried_once(self, tool_calls):
+        """Test that a write with no trace is sent once more, then given up."""
+        calls = tool_calls({
+            "create_pull_request": [TimeoutError("timed out"), TimeoutError("timed out")],
+            "list_pull_requests": ["[]"],
+        })
+        
+        assert asyncio.run(mcp_client.create_pull_request_async("o", "r", "T", "B", "fix/x")) is None
+        assert calls == ["create_pull_request", "list_pull_requests", "create_pull_request"]
+    
+    def test_permanent_write_error_is_not_retried(self, tool_calls):
+        """Test that a 422 from a write fails immediately."""
+        calls = tool_calls({
+            "push_files": [Exception("Validation Error: Invalid request")],
+        })
+        
+        assert asyncio.run(mcp_client.push_files_async("o", "r", "fix/x", [], "fix: x")) is False
+        assert calls == ["push_files"]
+
+
+class TestFileCache:
+    """Tests for the get_file_contents TTL cache."""
+    
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch):
+        monkeypatch.setattr(mcp_client, "_file_cache", OrderedDict())
+    
+    def test_repeated_reads_are_cached(self, tool_calls):
+        """Test that files fetched together are read from GitHub once."""
+        calls = tool_calls({"get_file_contents": ["a", "b"]})
+        
+        for _ in range(2):
+            contents = asyncio.run(mcp_client.get_files_contents_async("o", "r", ["a.cpp", "b.cpp"]))
+            assert contents == ["a", "b"]
+        assert calls == ["get_file_contents", "get_file_contents"]
+    
+    def test_entries_expire_after_ttl(self, tool_calls, monkeypatch):
+        """Test that MCP_FILE_CACHE_TTL=0 makes every read go to GitHub."""
+        monkeypatch.setattr(mcp_client.get_config(), "mcp_file_cache_ttl", 0.0)
+        calls = tool_calls({"get_file_contents": ["v1", "v2"]})
+        
+        assert asyncio.run(mcp_client.get_file_contents_async("o", "r", "a.cpp")) == "v1"
+        assert asyncio.run(mcp_client.get_file_contents_async("o", "r", "a.cpp")) == "v2"
+        assert calls == ["get_file_contents", "get_file_contents"]
+    
+    def test_push_drops_branch_files(self, tool_calls):
+        """Test that a successful push invalidates the branch's cached files."""
+        calls = tool_calls({
+            "get_file_contents": ["old", "new"],
+            "push_files": ["ok"],
+        })
+        
+        assert asyncio.run(mcp_client.get_file_contents_async("o", "r", "a.cpp", "fix/x")) == "old"
+        assert asyncio.run(mcp_client.push_files_async("o", "r", "fix/x", [], "fix: x")) is True
+        assert asyncio.run(mcp_client.get_file_contents_async("o", "r", "a.cpp", "fix/x")) == "new"
+        assert calls == ["get_file_contents", "push_files", "get_file_contents"]
@@ -0,0 +1,84 @@
+"""
+Unit tests for source code lookup in the error analyzer.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agent.nodes import error_analyzer
+
+
+@pytest.fixture
+def source_dir(tmp_path, monkeypatch):
+    """A local source directory, with GitHub lookups disabled."""
+    monkeypatch.setattr(error_analyzer, "_get_source_with_includes", lambda source_file: None)
+    return tmp_path
+
+
+def _touch_later(path, seconds: int = 5):
+    """Move a path's mtime forward, as a later edit would."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 10**9))
+
+
+class TestGetSourceCode:
+    """Tests for _get_source_code with local files."""
+    
+    def test_edited_file_is_read_again(self, source_dir):
+        """Test that a file edited mid-run is not served from the cache."""
+        source = source_dir / "translator.cpp"
+        source.write_text("v1\n")
+        assert error_analyzer._get_source_code("translator.cpp", source_dir) == "v1\n"
+        
+        source.write_text("v2 longer\n")
+        _touch_later(source)
+        assert error_analyzer._get_source_code("translator.cpp", source_dir) == "v2 longer\n"
+    
+    def test_added_file_is_found(self, source_dir):
+        """Test that a file created after the directory was listed is found."""
+        (source_dir / "main.cpp").write_text("int main() {}\n")
+        assert error_analyzer._get_source_code("handler.cpp", source_dir) is None
+        
+        (source_dir / "handler.cpp").write_text("void handle() {}\n")
+        _touch_later(source_dir)
+        assert error_analyzer._get_source_code("handler.cpp", source_dir) == "void handle() {}\n"
+
+
+class TestGetSourceWithIncludes:
+    """Tests for sharing concurrent GitHub source fetches."""
+    
+    @pytest.fixture
+    def fetched(self, monkeypatch):
+        """Replace the GitHub fetch with a slow fake; returns the fetch log."""
+        fetched = []
+        
+        async def fetch(source_file, max_includes):
+            fetched.append(source_file)
+            await asyncio.sleep(0.2)
+            return "int x;"
+        
+        monkeypatch.setattr(error_analyzer, "_fetch_source_with_includes_async", fetch)
+        monkeypatch.setattr(error_analyzer.get_config(), "has_github_access", True)
+        return fetched
+    
+    def test_concurrent_threads_share_one_fetch(self, fetched):
+        """Test that analyses in worker threads wait on the first fetch."""
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(error_analyzer._get_source_with_includes, "a.cpp") for _ in range(4)]
+            results = [future.result() for future in futures]
+        
+        assert results == ["int x;"] * 4
+        assert fetched == ["a.cpp"]
+    
+    def test_concurrent_coroutines_share_one_fetch(self, fetched):
+        """Test that async analyses await the first fetch without blocking the loop."""
+        async def lookups():
+            return await asyncio.gather(*[
+                error_analyzer._get_source_with_includes_async("a.cpp") for _ in range(4)
+            ])
+        
+        assert asyncio.run(lookups()) == ["int x;"] * 4
+        assert fetched == ["a.cpp"]
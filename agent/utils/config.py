@@ -5,10 +5,73 @@ Loads settings from environment variables and .env file.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from dotenv import load_dotenv
+
+@lru_cache(maxsize=1)
+def _find_env_path() -> Optional[Path]:
+    """
+    Find the .env file to load.
+    
+    DOTENV_PATH overrides the search; otherwise the current directory and
+    up to 4 parents are tried, then the agent module directory. The result
+    is cached, so resetting the Config singleton doesn't search again.
+    
+    Returns:
+        Path to the .env file, or None if there is none
+    """
+    override = os.environ.get("DOTENV_PATH")
+    if override:
+        return Path(override).expanduser()
+    
+    # Try to find .env in current directory or parent directories
+    current = Path.cwd()
+    for _ in range(5):  # Search up to 5 levels up
+        env_path = current / ".env"
+        if env_path.exists():
+            return env_path
+        current = current.parent
+    
+    # Also try the agent module directory
+    agent_dir = Path(__file__).parent.parent.parent
+    env_path = agent_dir / ".env"
+    if env_path.exists():
+        return env_path
+    
+    return None
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    """
+    Read an integer setting from the environment.
+    
+    Invalid values fall back to the default and values below the
+    minimum are raised to it, with a warning instead of a crash.
+    
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or invalid
+        minimum: Smallest allowed value
+    
+    Returns:
+        The setting's value
+    """
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    
+    try:
+        value = int(raw)
+    except ValueError:
+        print(f"⚠️ {name}={raw!r} is not an integer; using {default}")
+        return default
+    
+    if value < minimum:
+        print(f"⚠️ {name}={value} is below {minimum}; using {minimum}")
+        return minimum
+    return value
 
 
 class Config:
@@ -35,9 +98,6 @@ class Config:
         # Find and load .env file
         self._load_env()
         
-        # Google Gemini API
-        self.google_api_key: str = os.getenv("GOOGLE_API_KEY", "")
-        
         # GitHub settings
         self.github_token: str = os.getenv("GITHUB_TOKEN", "")
         self.github_repo: str = os.getenv("GITHUB_REPO", "")
@@ -62,37 +122,35 @@ class Config:
         # General settings
         self.temperature: float = float(os.getenv("TEMPERATURE", "0.2"))
         
+        # Maximum concurrent LLM requests
+        self.max_concurrency: int = _env_int("MAX_CONCURRENCY", 4, minimum=1)
+        
+        # Optional directory for the persistent LLM response cache (needs diskcache)
+        self.llm_cache_dir: str = os.getenv("LLM_CACHE_DIR", "")
+        
+        # Seconds before a GitHub MCP tool call is abandoned and retried (0 = no limit)
+        self.mcp_timeout: float = float(os.getenv("MCP_TIMEOUT", "30"))
+        
+        # Seconds GitHub file contents fetched via MCP stay cached
+        self.mcp_file_cache_ttl: float = float(os.getenv("MCP_FILE_CACHE_TTL", "60"))
+        
+        # Derived flags, computed once (settings don't change after load):
+        # whether the selected LLM provider has a key, and GitHub access
+        self.is_configured: bool = bool(
+            self.groq_api_key if self.llm_provider == "groq" else self.google_api_key
+        )
+        self.has_github_access: bool = bool(self.github_token and self.github_repo)
+        
         self._initialized = True
     
     def _load_env(self) -> None:
         """Load .env file if it exists."""
-        # Try to find .env in current directory or parent directories
-        current = Path.cwd()
-        for _ in range(5):  # Search up to 5 levels up
-            env_path = current / ".env"
-            if env_path.exists():
-                load_dotenv(env_path)
-                return
-            current = current.parent
-        
-        # Also try the agent module directory
-        agent_dir = Path(__file__).parent.parent.parent
-        env_path = agent_dir / ".env"
-        if env_path.exists():
+        env_path = _find_env_path()
+        if env_path is not None:
+            # Imported here so processes without a .env never load dotenv
+            from dotenv import load_dotenv
             load_dotenv(env_path)
     
-    @property
-    def is_configured(self) -> bool:
-        """Check if required configuration is present."""
-        if self.llm_provider == "groq":
-            return bool(self.groq_api_key)
-        return bool(self.google_api_key)
-    
-    @property
-    def has_github_access(self) -> bool:
-        """Check if GitHub access is configured."""
-        return bool(self.github_token and self.github_repo)
-    
     def validate(self) -> list[str]:
         """
         Validate configuration and return list of missing items.
@@ -133,7 +191,8 @@ class Config:
             f"  github_repo={self.github_repo or 'NOT SET'},\n"
             f"  github_target_branch={self.github_target_branch},\n"
             f"  source_path={self.source_path},\n"
-            f"  model_name={self.model_name}\n"
+            f"  llm_provider={self.llm_provider},\n"
+            f"  model={self.groq_model if self.llm_provider == 'groq' else self.gemini_model}\n"
             f")"
         )
 
@@ -141,3 +200,17 @@ class Config:
 def get_config() -> Config:
     """Get the configuration singleton."""
     return Config()
+
+
+def reload_config() -> Config:
+    """
+    Re-read the configuration from the environment.
+    
+    get_config() parses the environment only once per process; call
+    this (e.g. in tests) after changing environment variables.
+    
+    Returns:
+        The new configuration singleton
+    """
+    Config._instance = None
+    return Config()
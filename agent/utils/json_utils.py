@@ -0,0 +1,49 @@
+"""
+JSON helpers for LLM responses.
+"""
+
+import json
+import re
+from typing import Any, Mapping
+
+try:
+    # Optional faster JSON decoder (raises a json.JSONDecodeError subclass)
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+# Outermost {...} block, for responses with text around the JSON
+_JSON_BLOCK_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def parse_llm_json(response: str, default: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Parse a JSON object from an LLM response.
+    
+    Handles markdown code fences and surrounding prose.
+    
+    Args:
+        response: Raw LLM response string
+        default: Result to return if no JSON can be parsed (returned as-is,
+                 so pass a read-only mapping)
+    
+    Returns:
+        Parsed dictionary
+    """
+    # Remove a markdown code fence around the whole response
+    text = response.strip().removeprefix('```json').removeprefix('```')
+    text = text.removesuffix('```').strip()
+    
+    try:
+        return _json_loads(text)
+    except json.JSONDecodeError:
+        # Try to find JSON in the response
+        json_match = _JSON_BLOCK_RE.search(text)
+        if json_match:
+            try:
+                return _json_loads(json_match.group())
+            except json.JSONDecodeError:
+                pass
+        
+        return default
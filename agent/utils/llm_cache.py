@@ -0,0 +1,205 @@
+"""
+Prompt cache for LLM calls.
+
+Stores LLM response text keyed by a SHA-256 of the model, temperature
+and messages, so repeated errors in a log don't pay for another LLM
+round-trip. Only responses that parse as JSON are stored.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+from .config import get_config
+from .json_utils import parse_llm_json
+
+try:
+    # Optional faster JSON encoder for cache keys
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _message_role(message: Any) -> str:
+    """Get the role of a LangChain message (e.g. "system", "human")."""
+    return getattr(message, "type", message.__class__.__name__)
+
+
+def llm_identity(llm: Any) -> tuple[str, float | None]:
+    """
+    Get the (model name, temperature) that identifies an LLM's output.
+    
+    Works for ChatGroq (model_name) and ChatGoogleGenerativeAI (model).
+    """
+    model = getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__
+    return str(model), getattr(llm, "temperature", None)
+
+
+class LLMCache:
+    """
+    Exact-match cache of LLM responses.
+    
+    An in-memory LRU is always used; a disk tier (diskcache) is added
+    when a cache directory is configured and diskcache is installed.
+    """
+    
+    def __init__(self, max_entries: int = 1024, cache_dir: Optional[str] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of in-memory entries
+            cache_dir: Optional directory for the persistent disk tier
+        """
+        self.max_entries = max_entries
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = None
+        
+        if cache_dir:
+            try:
+                import diskcache
+            except ImportError:
+                print("⚠️ LLM_CACHE_DIR is set but diskcache is not installed; using memory cache only")
+            else:
+                self._disk = diskcache.Cache(str(Path(cache_dir).expanduser()))
+    
+    @staticmethod
+    def make_key(model: str, messages: list, temperature: float | None) -> str:
+        """
+        Build the cache key for a request.
+        
+        Args:
+            model: Model name
+            messages: LangChain messages sent to the model
+            temperature: Sampling temperature
+        
+        Returns:
+            Hex SHA-256 of the canonical request
+        """
+        payload = {
+            "model": model,
+            "messages": [
+                {"role": _message_role(m), "content": m.content}
+                for m in messages
+            ],
+            "temperature": temperature,
+        }
+        if orjson is not None:
+            canonical = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        else:
+            # Same bytes as orjson, so keys survive installing/removing it
+            canonical = json.dumps(
+                payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+        return hashlib.sha256(canonical).hexdigest()
+    
+    def get(self, model: str, messages: list, temperature: float | None) -> str | None:
+        """
+        Get the cached response text for a request.
+        
+        Returns:
+            Response text, or None on a miss
+        """
+        key = self.make_key(model, messages, temperature)
+        
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        
+        if self._disk is not None:
+            content = self._disk.get(key)
+            if content is not None:
+                self._remember(key, content)
+                return content
+        
+        return None
+    
+    def set(self, model: str, messages: list, temperature: float | None, content: str) -> None:
+        """Store the response text for a request."""
+        key = self.make_key(model, messages, temperature)
+        self._remember(key, content)
+        
+        if self._disk is not None:
+            self._disk.set(key, content)
+    
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+    
+    def _remember(self, key: str, content: str) -> None:
+        """Store an entry in the in-memory LRU, evicting the oldest."""
+        with self._lock:
+            self._memory[key] = content
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+
+_llm_cache: LLMCache | None = None
+
+
+def get_llm_cache() -> LLMCache:
+    """Get the process-wide LLM cache."""
+    global _llm_cache
+    
+    if _llm_cache is None:
+        _llm_cache = LLMCache(cache_dir=get_config().llm_cache_dir)
+    
+    return _llm_cache
+
+
+def invoke_cached(llm: Any, messages: list, default: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Invoke the LLM and parse its JSON reply, using the cache when available.
+    
+    On a miss the response is streamed and its chunks joined once,
+    so the JSON is parsed a single time on the complete text. Replies
+    that can't be parsed (e.g. truncated) are not cached, so the next
+    call asks the LLM again instead of replaying the failure.
+    
+    Args:
+        llm: The LLM instance
+        messages: LangChain messages to send
+        default: Result if the reply can't be parsed (see parse_llm_json)
+    
+    Returns:
+        Parsed JSON reply, or default
+    """
+    cache = get_llm_cache()
+    model, temperature = llm_identity(llm)
+    
+    content = cache.get(model, messages, temperature)
+    if content is not None:
+        return parse_llm_json(content, default)
+    
+    content = "".join([chunk.content for chunk in llm.stream(messages)])
+    parsed = parse_llm_json(content, default)
+    if parsed is not default:
+        cache.set(model, messages, temperature, content)
+    
+    return parsed
+
+
+async def ainvoke_cached(llm: Any, messages: list, default: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Async version of invoke_cached."""
+    cache = get_llm_cache()
+    model, temperature = llm_identity(llm)
+    
+    content = cache.get(model, messages, temperature)
+    if content is not None:
+        return parse_llm_json(content, default)
+    
+    content = "".join([chunk.content async for chunk in llm.astream(messages)])
+    parsed = parse_llm_json(content, default)
+    if parsed is not default:
+        cache.set(model, messages, temperature, content)
+    
+    return parsed
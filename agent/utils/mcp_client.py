@@ -5,21 +5,82 @@ Connects to the GitHub MCP server and provides tools to LangChain agents.
 """
 
 import asyncio
+import atexit
+import contextlib
+import contextvars
+import json
 import os
+import random
+import re
 import subprocess
 import sys
-from typing import Any
-
-from langchain_mcp_adapters.client import MultiServerMCPClient
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Coroutine, TypeVar
 
 from .config import get_config
 
+if TYPE_CHECKING:
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+
 
 # Global MCP client instance
-_mcp_client: MultiServerMCPClient | None = None
+_mcp_client: "MultiServerMCPClient | None" = None
+
+# GitHub MCP tools by name, loaded once per client
+_mcp_tools: dict[str, Any] | None = None
+
+# Tools bound to the session opened by github_session(), if any
+_session_tools: contextvars.ContextVar[dict[str, Any] | None] = contextvars.ContextVar(
+    "_session_tools", default=None
+)
+
+# Background event loop for the *_sync wrappers. It keeps one GitHub
+# MCP session (one server process) open for the life of the process
+# instead of starting the server again for every call.
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_loop_lock = threading.Lock()
+_loop_session: "asyncio.Task[None] | None" = None
+_loop_session_tools: "asyncio.Future[dict[str, Any]] | None" = None
+_loop_session_stop: asyncio.Event | None = None
+
+T = TypeVar("T")
+
+# Retry policy for transient GitHub failures (rate limits, 5xx) on reads.
+# Writes are retried at most once; see _call_write_tool.
+MAX_READ_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+_TRANSIENT_MARKERS = (
+    "rate limit", "bad gateway", "service unavailable", "gateway timeout", "timed out",
+)
 
+# Error kinds reported by @modelcontextprotocol/server-github, by HTTP status
+_ERROR_KIND_STATUS = {
+    "Authentication Failed": 401,
+    "Permission Denied": 403,
+    "Not Found": 404,
+    "Conflict": 409,
+    "Validation Error": 422,
+    "Rate Limit Exceeded": 429,
+}
+_ERROR_KIND_RE = re.compile(
+    r'^(?:MCP error -?\d+:\s*)?(?:Error:\s*)?(' + '|'.join(_ERROR_KIND_STATUS) + '):'
+)
+# Explicit status mentions, e.g. "status 503" or "HTTP/1.1 502"
+_STATUS_RE = re.compile(r'\b(?:status(?:[ _]code)?|HTTP(?:/[\d.]+)?)\W{0,3}([1-5]\d\d)\b', re.IGNORECASE)
 
-def _get_mcp_client() -> MultiServerMCPClient:
+# Cache of get_file_contents results, keyed by
+# (owner, repo, branch, path) -> (fetched at, content or None).
+# Entries expire after Config.mcp_file_cache_ttl seconds (default 60).
+FILE_CACHE_MAX_ENTRIES = 512
+_file_cache: OrderedDict[tuple[str, str, str, str], tuple[float, str | None]] = OrderedDict()
+_file_cache_lock = threading.Lock()
+
+
+def _get_mcp_client() -> "MultiServerMCPClient":
     """
     Get or create the MCP client connected to GitHub server.
     
@@ -31,6 +92,9 @@ def _get_mcp_client() -> MultiServerMCPClient:
     if _mcp_client is not None:
         return _mcp_client
     
+    # Imported on first use; the MCP stack is slow to load
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+    
     config = get_config()
     
     # Configure the GitHub MCP server
@@ -60,23 +124,334 @@ async def _call_tool_async(tool_name: str, arguments: dict[str, Any]) -> Any:
     Returns:
         Tool execution result
     """
+    global _mcp_tools
+    
+    tools = _session_tools.get()
+    if tools is None and _on_background_loop():
+        tools = await _get_loop_session_tools()
+    if tools is None:
+        # Listing tools starts its own server session, so do it only once;
+        # outside github_session() each tool call opens a fresh session
+        if _mcp_tools is None:
+            client = _get_mcp_client()
+            _mcp_tools = _tools_by_name(await client.get_tools())
+        tools = _mcp_tools
+    
+    tool = tools.get(tool_name)
+    if tool is None:
+        raise ValueError(f"Tool '{tool_name}' not found in GitHub MCP server")
+    
+    # Bound each call so a stalled server or network is retried
+    timeout = get_config().mcp_timeout
+    try:
+        return await asyncio.wait_for(tool.ainvoke(arguments), timeout=timeout if timeout > 0 else None)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"{tool_name} timed out after {timeout:g}s") from None
+
+
+@contextlib.asynccontextmanager
+async def github_session() -> AsyncIterator[None]:
+    """
+    Keep one GitHub MCP server session open for the calls in the block.
+    
+    Without it every tool call starts its own server process (npx);
+    inside it, all calls from this task (and tasks it starts) share
+    one session.
+    """
+    if _session_tools.get() is not None or _on_background_loop():
+        # Already inside a session (the background loop keeps its own open)
+        yield
+        return
+    
+    from langchain_mcp_adapters.tools import load_mcp_tools
+    
     client = _get_mcp_client()
+    async with client.session("github") as session:
+        tools = await load_mcp_tools(session)
+        token = _session_tools.set(_tools_by_name(tools))
+        try:
+            yield
+        finally:
+            _session_tools.reset(token)
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run an MCP coroutine from synchronous code.
+    
+    The coroutine runs on a shared background event loop inside a
+    GitHub MCP session that stays open between calls, so the server
+    process is started once per process rather than once per call.
+    Safe to call from several threads at once.
+    
+    Args:
+        coro: Coroutine using the MCP helpers in this module
+    
+    Returns:
+        The coroutine's result
+    """
+    loop = _get_background_loop()
+    if threading.current_thread() is _loop_thread:
+        raise RuntimeError("run_sync() called from the MCP event loop; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+async def run_on_mcp_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Await an MCP coroutine from another event loop.
+    
+    Async counterpart of run_sync: the coroutine runs in the background
+    loop's shared session while the calling loop stays free. Inside
+    github_session() (or on the background loop) it is awaited directly.
+    
+    Args:
+        coro: Coroutine using the MCP helpers in this module
+    
+    Returns:
+        The coroutine's result
+    """
+    if _session_tools.get() is not None or _on_background_loop():
+        return await coro
+    loop = _get_background_loop()
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the background MCP event loop, starting it on first use."""
+    global _loop, _loop_thread
+    
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_loop.run_forever, name="mcp-loop", daemon=True)
+            _loop_thread.start()
+            atexit.register(_stop_background_loop)
+    
+    return _loop
+
+
+def _on_background_loop() -> bool:
+    """Check whether the caller is running on the background MCP loop."""
+    return _loop_thread is not None and threading.current_thread() is _loop_thread
+
+
+async def _get_loop_session_tools() -> dict[str, Any] | None:
+    """
+    Get the tools of the background loop's shared session, opening it
+    on first use.
+    
+    Returns:
+        Tools by name, or None if the session could not be opened
+    """
+    global _loop_session, _loop_session_tools, _loop_session_stop
+    
+    if _loop_session_tools is None:
+        _loop_session_tools = asyncio.get_running_loop().create_future()
+        _loop_session_stop = asyncio.Event()
+        _loop_session = asyncio.create_task(
+            _hold_loop_session(_loop_session_tools, _loop_session_stop)
+        )
+    
+    try:
+        return await asyncio.shield(_loop_session_tools)
+    except Exception as e:
+        # Fall back to a session per call (e.g. if the server can't start)
+        print(f"⚠️ MCP session could not be opened: {e}")
+        return None
+
+
+async def _hold_loop_session(tools: "asyncio.Future[dict[str, Any]]", stop: asyncio.Event) -> None:
+    """Open the shared session and keep it open until stop is set."""
+    global _loop_session, _loop_session_tools, _loop_session_stop
+    
+    from langchain_mcp_adapters.tools import load_mcp_tools
+    
+    try:
+        client = _get_mcp_client()
+        async with client.session("github") as session:
+            tools.set_result(_tools_by_name(await load_mcp_tools(session)))
+            await stop.wait()
+    except Exception as e:
+        if not tools.done():
+            tools.set_exception(e)
+    finally:
+        # The next call opens a new session (also after a failure)
+        if _loop_session_tools is tools:
+            _loop_session = _loop_session_tools = _loop_session_stop = None
+
+
+async def _close_loop_session() -> None:
+    """Close the background loop's shared session, if open."""
+    session, stop = _loop_session, _loop_session_stop
+    if session is None or stop is None:
+        return
+    stop.set()
+    with contextlib.suppress(Exception):
+        await session
+
+
+def _stop_background_loop() -> None:
+    """Close the shared session and stop the background loop."""
+    global _loop, _loop_thread
+    
+    with _loop_lock:
+        loop, thread = _loop, _loop_thread
+        _loop = _loop_thread = None
+    if loop is None:
+        return
     
-    # Get tools (new API - not a context manager)
-    tools = await client.get_tools()
+    with contextlib.suppress(Exception):
+        asyncio.run_coroutine_threadsafe(_close_loop_session(), loop).result(timeout=5)
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join(timeout=5)
+
+
+def _tools_by_name(tools: list[Any]) -> dict[str, Any]:
+    """
+    Index loaded MCP tools by name.
     
-    # Find the tool by name
+    Tool errors are made to raise: by default the adapter returns a
+    GitHub error (404, 422, ...) as ordinary content, which would look
+    like a successful call.
+    """
     for tool in tools:
-        if tool.name == tool_name:
-            result = await tool.ainvoke(arguments)
-            return result
+        tool.handle_tool_error = False
+    return {tool.name: tool for tool in tools}
+
+
+def _http_status(error: Exception) -> int | None:
+    """
+    Get the HTTP status behind a tool error, if it can be determined.
+    
+    Uses a status attribute when the error has one, else the error kind
+    prefix the GitHub MCP server puts on its messages, else an explicit
+    "status NNN" mention. Bare numbers elsewhere in the message (SHAs,
+    line numbers, paths) are ignored.
+    """
+    for source in (error, getattr(error, "response", None)):
+        for attr in ("status", "status_code"):
+            status = getattr(source, attr, None)
+            if isinstance(status, int):
+                return status
     
-    raise ValueError(f"Tool '{tool_name}' not found in GitHub MCP server")
+    message = str(error).lstrip()
+    kind = _ERROR_KIND_RE.match(message)
+    if kind:
+        return _ERROR_KIND_STATUS[kind.group(1)]
+    mention = _STATUS_RE.search(message)
+    if mention:
+        return int(mention.group(1))
+    return None
 
 
-def get_file_contents_sync(owner: str, repo: str, path: str, branch: str = "main") -> str | None:
+def _is_transient(error: Exception) -> bool:
+    """Check whether a tool error looks like a rate limit or server hiccup."""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    status = _http_status(error)
+    if status is not None:
+        return status == 429 or 500 <= status < 600
+    message = str(error).lower()
+    return any(marker in message for marker in _TRANSIENT_MARKERS)
+
+
+async def _call_tool_with_retry(tool_name: str, arguments: dict[str, Any]) -> Any:
     """
-    Synchronous wrapper to get file contents from GitHub via MCP.
+    Call a read-only GitHub MCP tool, retrying transient failures.
+    
+    Backs off exponentially with jitter (capped at RETRY_MAX_DELAY)
+    for up to MAX_READ_ATTEMPTS attempts. Other errors are raised
+    immediately.
+    """
+    for attempt in range(MAX_READ_ATTEMPTS):
+        try:
+            return await _call_tool_async(tool_name, arguments)
+        except Exception as e:
+            if attempt == MAX_READ_ATTEMPTS - 1 or not _is_transient(e):
+                raise
+            delay = min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY)
+            delay += random.uniform(0, RETRY_BASE_DELAY)
+            print(f"⚠️ MCP {tool_name} failed ({e}); retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+async def _call_write_tool(
+    tool_name: str,
+    arguments: dict[str, Any],
+    already_applied: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Call a GitHub MCP tool that changes the repository.
+    
+    A write that failed transiently may still have been applied (e.g. a
+    timeout after GitHub handled the request), so it is retried at most
+    once, and only if already_applied() finds no trace of it.
+    
+    Args:
+        tool_name: Name of the tool to call
+        arguments: Tool arguments
+        already_applied: Returns the write's result if it already took
+                         effect, None otherwise
+    
+    Returns:
+        Tool execution result
+    """
+    try:
+        return await _call_tool_async(tool_name, arguments)
+    except Exception as e:
+        if not _is_transient(e):
+            raise
+        print(f"⚠️ MCP {tool_name} failed ({e}); checking whether it was applied")
+    
+    await asyncio.sleep(RETRY_BASE_DELAY + random.uniform(0, RETRY_BASE_DELAY))
+    applied = await already_applied()
+    if applied is not None:
+        return applied
+    return await _call_tool_async(tool_name, arguments)
+
+
+def _result_json(result: Any) -> Any:
+    """Decode the JSON text of an MCP tool result (plain text or text blocks)."""
+    if isinstance(result, list):
+        result = "".join(
+            block.get("text", "") if isinstance(block, dict) else str(block)
+            for block in result
+        )
+    return json.loads(_extract_str(result, "text") or "null")
+
+
+async def _latest_commit(owner: str, repo: str, branch: str) -> dict | None:
+    """Get the head commit of a branch, or None if the branch doesn't exist."""
+    try:
+        result = await _call_tool_with_retry(
+            "list_commits",
+            {"owner": owner, "repo": repo, "sha": branch, "perPage": 1}
+        )
+    except Exception as e:
+        if _http_status(e) in (404, 409, 422):
+            return None
+        raise
+    commits = _result_json(result)
+    return commits[0] if commits else None
+
+
+async def _find_open_pull_request(owner: str, repo: str, head: str, base: str) -> str | None:
+    """Get the URL of an open PR from head into base, if there is one."""
+    result = await _call_tool_with_retry(
+        "list_pull_requests",
+        {"owner": owner, "repo": repo, "state": "open", "head": f"{owner}:{head}", "base": base}
+    )
+    pulls = _result_json(result)
+    return pulls[0].get("html_url") if pulls else None
+
+
+async def get_file_contents_async(owner: str, repo: str, path: str, branch: str = "main") -> str | None:
+    """
+    Get file contents from GitHub via MCP.
+    
+    Results (including misses) are cached for MCP_FILE_CACHE_TTL
+    seconds; pushing to a branch drops its cached files.
     
     Args:
         owner: Repository owner
@@ -87,31 +462,105 @@ def get_file_contents_sync(owner: str, repo: str, path: str, branch: str = "main
     Returns:
         File contents as string, or None if not found
     """
-    try:
-        # Create a new event loop for this call to avoid TaskGroup issues
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(_call_tool_async(
-                "get_file_contents",
-                {
-                    "owner": owner,
-                    "repo": repo,
-                    "path": path,
-                    "branch": branch,
-                }
-            ))
-        finally:
-            loop.close()
-        
-        # Extract content from result
-        if isinstance(result, str):
+    key = (owner, repo, branch, path)
+    now = time.monotonic()
+    ttl = get_config().mcp_file_cache_ttl
+    with _file_cache_lock:
+        cached = _file_cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            _file_cache.move_to_end(key)
+            return cached[1]
+    
+    content = await _fetch_file_contents(owner, repo, path, branch)
+    
+    with _file_cache_lock:
+        _file_cache[key] = (now, content)
+        _file_cache.move_to_end(key)
+        while len(_file_cache) > FILE_CACHE_MAX_ENTRIES:
+            _file_cache.popitem(last=False)
+    
+    return content
+
+
+def get_file_contents_sync(owner: str, repo: str, path: str, branch: str = "main") -> str | None:
+    """Synchronous wrapper for get_file_contents_async."""
+    return run_sync(get_file_contents_async(owner, repo, path, branch))
+
+
+async def get_files_contents_async(
+    owner: str,
+    repo: str,
+    paths: list[str],
+    branch: str = "main"
+) -> list[str | None]:
+    """
+    Get several files from GitHub via MCP concurrently.
+    
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        paths: File paths in the repository
+        branch: Branch name (default: main)
+    
+    Returns:
+        File contents (None if not found), in the order of paths
+    """
+    return list(await asyncio.gather(*[
+        get_file_contents_async(owner, repo, path, branch) for path in paths
+    ]))
+
+
+def get_files_contents_sync(
+    owner: str,
+    repo: str,
+    paths: list[str],
+    branch: str = "main"
+) -> list[str | None]:
+    """Synchronous wrapper for get_files_contents_async."""
+    return run_sync(get_files_contents_async(owner, repo, paths, branch))
+
+
+def _invalidate_file_cache(owner: str, repo: str, branch: str) -> None:
+    """Drop cached file contents for a branch after writing to it."""
+    with _file_cache_lock:
+        for key in [k for k in _file_cache if k[:3] == (owner, repo, branch)]:
+            del _file_cache[key]
+
+
+def _extract_str(result: Any, attr: str) -> str | None:
+    """
+    Get a string field from an MCP tool result.
+    
+    Args:
+        result: Tool result (plain text, a dict, or an object)
+        attr: Field to read when the result isn't plain text
+    
+    Returns:
+        The field, the result as text if it has no such field, or None if empty
+    """
+    match result:
+        case str():
             return result
-        elif hasattr(result, 'content'):
-            return result.content
-        elif isinstance(result, dict) and 'content' in result:
-            return result['content']
-        return str(result) if result else None
+        case dict() if attr in result:
+            return result[attr]
+        case _ if hasattr(result, attr):
+            return getattr(result, attr)
+    return str(result) if result else None
+
+
+async def _fetch_file_contents(owner: str, repo: str, path: str, branch: str) -> str | None:
+    """Fetch file contents from GitHub via MCP, bypassing the cache."""
+    try:
+        result = await _call_tool_with_retry(
+            "get_file_contents",
+            {
+                "owner": owner,
+                "repo": repo,
+                "path": path,
+                "branch": branch,
+            }
+        )
+        return _extract_str(result, "content")
         
     except Exception as e:
         error_msg = str(e)
@@ -121,7 +570,7 @@ def get_file_contents_sync(owner: str, repo: str, path: str, branch: str = "main
         return None
 
 
-def create_pull_request_sync(
+async def create_pull_request_async(
     owner: str,
     repo: str,
     title: str,
@@ -130,7 +579,7 @@ def create_pull_request_sync(
     base: str = "main"
 ) -> str | None:
     """
-    Synchronous wrapper to create a pull request via MCP.
+    Create a pull request via MCP.
     
     Args:
         owner: Repository owner
@@ -144,7 +593,7 @@ def create_pull_request_sync(
         PR URL if successful, None otherwise
     """
     try:
-        result = asyncio.run(_call_tool_async(
+        result = await _call_write_tool(
             "create_pull_request",
             {
                 "owner": owner,
@@ -153,26 +602,31 @@ def create_pull_request_sync(
                 "body": body,
                 "head": head,
                 "base": base,
-            }
-        ))
-        
-        # Extract URL from result
-        if isinstance(result, str):
-            return result
-        elif hasattr(result, 'html_url'):
-            return result.html_url
-        elif isinstance(result, dict) and 'html_url' in result:
-            return result['html_url']
-        return str(result) if result else None
+            },
+            lambda: _find_open_pull_request(owner, repo, head, base)
+        )
+        return _extract_str(result, "html_url")
         
     except Exception as e:
         print(f"⚠️ MCP create_pull_request failed: {e}")
         return None
 
 
-def create_branch_sync(owner: str, repo: str, branch: str, from_branch: str = "main") -> bool:
+def create_pull_request_sync(
+    owner: str,
+    repo: str,
+    title: str,
+    body: str,
+    head: str,
+    base: str = "main"
+) -> str | None:
+    """Synchronous wrapper for create_pull_request_async."""
+    return run_sync(create_pull_request_async(owner, repo, title, body, head, base))
+
+
+async def create_branch_async(owner: str, repo: str, branch: str, from_branch: str = "main") -> bool:
     """
-    Synchronous wrapper to create a branch via MCP.
+    Create a branch via MCP.
     
     Args:
         owner: Repository owner
@@ -184,22 +638,31 @@ def create_branch_sync(owner: str, repo: str, branch: str, from_branch: str = "m
         True if successful
     """
     try:
-        asyncio.run(_call_tool_async(
+        async def branch_exists() -> bool | None:
+            return True if await _latest_commit(owner, repo, branch) else None
+        
+        await _call_write_tool(
             "create_branch",
             {
                 "owner": owner,
                 "repo": repo,
                 "branch": branch,
                 "from_branch": from_branch,
-            }
-        ))
+            },
+            branch_exists
+        )
         return True
     except Exception as e:
         print(f"⚠️ MCP create_branch failed: {e}")
         return False
 
 
-def push_files_sync(
+def create_branch_sync(owner: str, repo: str, branch: str, from_branch: str = "main") -> bool:
+    """Synchronous wrapper for create_branch_async."""
+    return run_sync(create_branch_async(owner, repo, branch, from_branch))
+
+
+async def push_files_async(
     owner: str,
     repo: str,
     branch: str,
@@ -207,7 +670,7 @@ def push_files_sync(
     message: str
 ) -> bool:
     """
-    Synchronous wrapper to push files to GitHub via MCP.
+    Push files to GitHub in one commit via MCP.
     
     Args:
         owner: Repository owner
@@ -220,7 +683,13 @@ def push_files_sync(
         True if successful
     """
     try:
-        asyncio.run(_call_tool_async(
+        async def commit_pushed() -> bool | None:
+            head = await _latest_commit(owner, repo, branch)
+            if head and head.get("commit", {}).get("message") == message:
+                return True
+            return None
+        
+        await _call_write_tool(
             "push_files",
             {
                 "owner": owner,
@@ -228,15 +697,70 @@ def push_files_sync(
                 "branch": branch,
                 "files": files,
                 "message": message,
-            }
-        ))
+            },
+            commit_pushed
+        )
+        _invalidate_file_cache(owner, repo, branch)
         return True
     except Exception as e:
         print(f"⚠️ MCP push_files failed: {e}")
         return False
 
 
+def push_files_sync(
+    owner: str,
+    repo: str,
+    branch: str,
+    files: list[dict],
+    message: str
+) -> bool:
+    """Synchronous wrapper for push_files_async."""
+    return run_sync(push_files_async(owner, repo, branch, files, message))
+
+
+async def create_pr_pipeline_async(
+    owner: str,
+    repo: str,
+    branch: str,
+    files: list[dict],
+    message: str,
+    title: str,
+    body: str,
+    base: str = "main"
+) -> str | None:
+    """
+    Create a branch, push files to it and open a PR in one MCP session.
+    
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        branch: New branch name
+        files: List of {"path": str, "content": str} dicts
+        message: Commit message
+        title: PR title
+        body: PR description
+        base: Base and target branch (default: main)
+    
+    Returns:
+        PR URL if every step succeeded, None otherwise
+    """
+    try:
+        async with github_session():
+            if not await create_branch_async(owner, repo, branch, base):
+                return None
+            if not await push_files_async(owner, repo, branch, files, message):
+                return None
+            return await create_pull_request_async(owner, repo, title, body, branch, base)
+    except Exception as e:
+        print(f"⚠️ MCP session failed: {e}")
+        return None
+
+
 def cleanup_mcp():
     """Clean up MCP client."""
-    global _mcp_client
+    global _mcp_client, _mcp_tools
+    _stop_background_loop()
     _mcp_client = None
+    _mcp_tools = None
+    with _file_cache_lock:
+        _file_cache.clear()
@@ -7,21 +7,32 @@ Tests branch creation, file push, and PR creation via MCP.
 import asyncio
 from datetime import datetime
 
+import pytest
+
 # Add parent to path for imports
 import sys
 sys.path.insert(0, ".")
 
 from agent.utils.mcp_client import (
-    create_branch_sync,
-    push_files_sync,
-    create_pull_request_sync,
-    get_file_contents_sync,
+    create_branch_async,
+    push_files_async,
+    create_pull_request_async,
+    get_file_contents_async,
+    github_session,
 )
 from agent.utils.config import get_config
 
+# Shares one GitHub repo and branch; keep out of parallel runs
+pytestmark = pytest.mark.serial
+
 
 def test_get_file():
     """Test getting a file from GitHub via MCP."""
+    return asyncio.run(check_get_file())
+
+
+async def check_get_file():
+    """Get a file from GitHub via MCP."""
     config = get_config()
     owner, repo = config.github_repo.split("/")
     
@@ -29,7 +40,7 @@ def test_get_file():
     print("TEST: Get file contents via MCP")
     print("=" * 50)
     
-    result = get_file_contents_sync(
+    result = await get_file_contents_async(
         owner=owner,
         repo=repo,
         path="README.md",
@@ -47,6 +58,11 @@ def test_get_file():
 
 def test_create_branch():
     """Test creating a branch via MCP."""
+    return asyncio.run(check_create_branch())
+
+
+async def check_create_branch():
+    """Create a branch via MCP."""
     config = get_config()
     owner, repo = config.github_repo.split("/")
     
@@ -57,7 +73,7 @@ def test_create_branch():
     print(f"TEST: Create branch '{branch_name}' via MCP")
     print("=" * 50)
     
-    result = create_branch_sync(
+    result = await create_branch_async(
         owner=owner,
         repo=repo,
         branch=branch_name,
@@ -74,6 +90,11 @@ def test_create_branch():
 
 def test_push_files(branch_name: str):
     """Test pushing files via MCP."""
+    return asyncio.run(check_push_files(branch_name))
+
+
+async def check_push_files(branch_name: str):
+    """Push a file via MCP."""
     config = get_config()
     owner, repo = config.github_repo.split("/")
     
@@ -89,7 +110,7 @@ This file was created via MCP (Model Context Protocol).
 Created at: {datetime.now().isoformat()}
 """
     
-    result = push_files_sync(
+    result = await push_files_async(
         owner=owner,
         repo=repo,
         branch=branch_name,
@@ -107,6 +128,11 @@ Created at: {datetime.now().isoformat()}
 
 def test_create_pr(branch_name: str):
     """Test creating a PR via MCP."""
+    return asyncio.run(check_create_pr(branch_name))
+
+
+async def check_create_pr(branch_name: str):
+    """Create a PR via MCP."""
     config = get_config()
     owner, repo = config.github_repo.split("/")
     
@@ -115,7 +141,7 @@ def test_create_pr(branch_name: str):
     print(f"TEST: Create PR from '{branch_name}' via MCP")
     print("=" * 50)
     
-    result = create_pull_request_sync(
+    result = await create_pull_request_async(
         owner=owner,
         repo=repo,
         title="[TEST] MCP Integration Test",
@@ -132,26 +158,32 @@ def test_create_pr(branch_name: str):
     return result
 
 
+async def run_all() -> str | None:
+    """Run every check in order over one MCP server session."""
+    async with github_session():
+        # Test 1: Get file
+        if not await check_get_file():
+            print("\n⚠️ File fetching failed, but continuing with other tests...")
+        
+        # Test 2: Create branch
+        branch = await check_create_branch()
+        if not branch:
+            print("\n❌ Cannot continue without a branch")
+            exit(1)
+        
+        # Test 3: Push files
+        if not await check_push_files(branch):
+            print("\n❌ Cannot create PR without pushing files")
+            exit(1)
+        
+        # Test 4: Create PR
+        return await check_create_pr(branch)
+
+
 if __name__ == "__main__":
     print("\n🧪 MCP GitHub Integration Test\n")
     
-    # Test 1: Get file
-    if not test_get_file():
-        print("\n⚠️ File fetching failed, but continuing with other tests...")
-    
-    # Test 2: Create branch
-    branch = test_create_branch()
-    if not branch:
-        print("\n❌ Cannot continue without a branch")
-        exit(1)
-    
-    # Test 3: Push files
-    if not test_push_files(branch):
-        print("\n❌ Cannot create PR without pushing files")
-        exit(1)
-    
-    # Test 4: Create PR
-    pr_url = test_create_pr(branch)
+    pr_url = asyncio.run(run_all())
     
     print()
     print("=" * 50)